@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import json
 import logging
+import time
 from datetime import datetime, date
 from decimal import Decimal
 from typing import AsyncGenerator, Optional, Dict, Any, List, Literal
@@ -37,7 +38,7 @@ from sse_starlette.sse import EventSourceResponse
 from assistant_stream import create_run, RunController
 from assistant_stream.serialization import DataStreamResponse
 
-from workflow.graph import get_workflow, create_workflow
+from workflow.graph import get_workflow, create_workflow, MAX_QUERY_LEN, _reject_long_query
 from workflow.state import create_initial_state
 from graph.graph_builder import NODE_TYPES  # Phase 102: 노드 타입 색상
 from graph.cugraph_client import CuGraphClient  # Phase 104.6: cuGraph 그래프 생성
@@ -278,6 +279,17 @@ async def stream_workflow_sse(request: StreamChatRequest) -> EventSourceResponse
     """
     async def event_generator() -> AsyncGenerator[dict, None]:
         try:
+            # 길이 초과 질문은 워크플로우 실행 없이 에러 이벤트로 응답
+            if len(request.query) > MAX_QUERY_LEN:
+                rejected = _reject_long_query(request.query, request.session_id, time.time())
+                yield {
+                    "event": "error",
+                    "data": safe_json_dumps({
+                        "error": rejected["response"]
+                    }, ensure_ascii=False)
+                }
+                return
+
             # 워크플로우 가져오기
             workflow = get_workflow()
             initial_state = create_initial_state(
@@ -299,7 +311,6 @@ async def stream_workflow_sse(request: StreamChatRequest) -> EventSourceResponse
             # 워크플로우 스트리밍 실행
             final_state = None
             stage_timing = {}
-            import time
             stage_start = time.time()
 
             async for event in workflow.astream(initial_state, stream_mode="updates"):
@@ -927,6 +938,12 @@ async def stream_workflow_datastream(request: StreamChatRequest):
     """
     async def run(controller: RunController):
         try:
+            # 길이 초과 질문은 워크플로우 실행 없이 안내 문구만 전송
+            if len(request.query) > MAX_QUERY_LEN:
+                rejected = _reject_long_query(request.query, request.session_id, time.time())
+                controller.append_text(rejected["response"])
+                return
+
             # 워크플로우 가져오기
             workflow = get_workflow()
             initial_state = create_initial_state(
@@ -966,6 +983,11 @@ async def stream_workflow_chunks(request: StreamChatRequest) -> AsyncGenerator[s
         str: 응답 텍스트 청크
     """
     try:
+        # 길이 초과 질문은 워크플로우 실행 없이 안내 문구만 반환
+        if len(request.query) > MAX_QUERY_LEN:
+            yield _reject_long_query(request.query, request.session_id, time.time())["response"]
+            return
+
         workflow = get_workflow()
         initial_state = create_initial_state(
             query=request.query,
@@ -9,9 +9,10 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
 import requests
 
@@ -25,6 +26,23 @@ from graph.node_resolver import get_node_resolver, NodeResolver
 
 logger = logging.getLogger(__name__)
 
+# (KURE API, 텍스트) 기준 임베딩 캐시 크기 (0이면 캐시 비활성화)
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "1024"))
+
+
+@lru_cache(maxsize=EMBEDDING_CACHE_SIZE)
+def _fetch_embedding(kure_api: str, text: str, timeout: float) -> Optional[Tuple[float, ...]]:
+    """KURE API 임베딩 호출 (성공 결과만 캐시 - 요청 실패 예외는 캐시되지 않음)"""
+    response = requests.post(kure_api, json={"text": text}, timeout=timeout)
+    response.raise_for_status()
+    embedding = response.json().get("embedding")
+    return tuple(embedding) if embedding else None
+
+
+def clear_embedding_cache() -> None:
+    """임베딩 캐시 초기화 (테스트/임베딩 모델 변경 시)"""
+    _fetch_embedding.cache_clear()
+
 
 class SearchStrategy(Enum):
     """검색 전략"""
@@ -78,16 +96,10 @@ class QdrantSearcher:
         }
 
     def get_embedding(self, text: str) -> Optional[List[float]]:
-        """KURE API로 임베딩 생성"""
+        """KURE API로 임베딩 생성 (동일 텍스트 반복 요청은 프로세스 캐시에서 반환)"""
         try:
-            response = requests.post(
-                self.kure_api,
-                json={"text": text},
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            result = response.json()
-            return result.get("embedding")
+            embedding = _fetch_embedding(self.kure_api, text, self.timeout)
+            return list(embedding) if embedding else None
         except Exception as e:
             logger.error(f"임베딩 생성 실패: {e}")
             return None
@@ -20,7 +20,8 @@ from sql.schema_analyzer import get_schema_analyzer, SchemaAnalyzer
 from sql.sql_prompts import (
     build_sql_generation_prompt,
     build_result_interpretation_prompt,
-    format_query_result
+    format_query_result,
+    format_entity_sql
 )
 from llm.llm_client import get_llm_client, LLMClient
 
@@ -317,9 +318,9 @@ class SQLAgent:
             {
                 "name": k,
                 "question": f"{ENTITY_LABELS.get(k, k)} 검색",
-                "sql": v["sql_template"].format(keyword="검색어")
+                "sql": format_entity_sql(k, "검색어")
             }
-            for k, v in ENTITY_COLUMNS.items()
+            for k in ENTITY_COLUMNS
         ]
 
 
@@ -5,6 +5,10 @@ SQL 에이전트 프롬프트 템플릿
 - 결과 해석 프롬프트
 """
 
+import sys
+from types import MappingProxyType
+from typing import NamedTuple, Optional, Tuple
+
 # SQL 생성 시스템 프롬프트 (Phase 35.3: 모듈화 - 토큰 최적화)
 # Phase 53: 장비 검색 시 핵심 키워드만 사용하도록 규칙 추가
 SQL_GENERATION_SYSTEM = """PostgreSQL 전문가. 자연어 질문을 SQL로 변환.
@@ -32,20 +36,41 @@ SQL_GENERATION_SYSTEM = """PostgreSQL 전문가. 자연어 질문을 SQL로 변
    - 예시3 (회사 특허 전체): WHERE patent_frst_appn ILIKE '%삼성전자%'
 
 ## Phase 104.3: 기관 역량 검색 (기관별 집계) - 중요!
-"역량 보유 기관", "개발 기관", "출원기관 TOP", "수행기관 TOP" 키워드 감지 시 **GROUP BY 집계 필수!**:
+"역량 보유 기관", "개발 기관", "출원기관 TOP", "수행기관 TOP" 키워드 감지 시 **GROUP BY 집계 필수!**
+- 특허: patent_frst_appn 기준 집계
+- 과제: f_proposal_orgn.orgn_nm 기준 집계 (ptcp_orgn_role_se로 주관/참여 구분)
+
+## 동향 분석 쿼리 (trend_analysis) - 1개 쿼리만!
+"~동향", "연구동향", "기술동향", "특허동향" 질문 시:
+- 연도별 추이 쿼리 (세미콜론 없이 1개만 생성): LEFT(날짜컬럼, 4)로 GROUP BY
+
+## 테이블 관계 (JOIN 시 참고)
+- f_patents.documentid = f_patent_applicants.document_id
+- f_proposal_profile.sbjt_id = f_proposal_techclsf.sbjt_id
 
-### 특허 출원기관 집계 (patent_frst_appn 기준)
-SELECT p.patent_frst_appn as 기관명, COUNT(*) as 특허수,
+## 출력
+SQL만 출력. 마크다운/설명 없이.
+"""
+
+# SQL 예시 뱅크 (질문에 매칭되는 예시만 사용자 프롬프트에 주입 - 토큰 최적화)
+# trigger_keywords 중 하나라도 질문에 포함되면 해당 예시 사용
+SQL_EXAMPLES = [
+    {
+        "title": "특허 출원기관 집계 (patent_frst_appn 기준)",
+        "trigger_keywords": ["역량", "개발 기관", "개발기관", "출원기관", "출원인", "보유 기관", "보유기관"],
+        "sql": """SELECT p.patent_frst_appn as 기관명, COUNT(*) as 특허수,
        MIN(LEFT(p.ptnaplc_ymd, 4)) as 첫출원년도,
        MAX(LEFT(p.ptnaplc_ymd, 4)) as 최근출원년도
 FROM "f_patents" p
 WHERE p.conts_klang_nm ILIKE '%키워드%'
   AND p.patent_frst_appn IS NOT NULL AND p.patent_frst_appn <> ''
 GROUP BY p.patent_frst_appn
-ORDER BY 특허수 DESC LIMIT 20
-
-### 과제 수행기관 집계 (f_proposal_orgn.orgn_nm + ptcp_orgn_role_se 역할 구분)
-SELECT po.orgn_nm as 기관명, COUNT(DISTINCT po.sbjt_id) as 과제수,
+ORDER BY 특허수 DESC LIMIT 20""",
+    },
+    {
+        "title": "과제 수행기관 집계 (f_proposal_orgn.orgn_nm + ptcp_orgn_role_se 역할 구분)",
+        "trigger_keywords": ["수행기관", "주관기관", "참여기관", "역량"],
+        "sql": """SELECT po.orgn_nm as 기관명, COUNT(DISTINCT po.sbjt_id) as 과제수,
        COUNT(CASE WHEN po.ptcp_orgn_role_se LIKE '%주관%' THEN 1 END) as 주관과제,
        COUNT(CASE WHEN po.ptcp_orgn_role_se LIKE '%참여%' THEN 1 END) as 참여과제
 FROM "f_proposal_orgn" po
@@ -53,22 +78,16 @@ JOIN "f_proposal_profile" pp ON po.sbjt_id = pp.sbjt_id
 WHERE pp.sbjt_nm ILIKE '%키워드%'
   AND po.orgn_nm IS NOT NULL AND po.orgn_nm <> ''
 GROUP BY po.orgn_nm
-ORDER BY 과제수 DESC LIMIT 20
-
-## 동향 분석 쿼리 (trend_analysis) - 1개 쿼리만!
-"~동향", "연구동향", "기술동향", "특허동향" 질문 시:
-- 연도별 추이 쿼리 (세미콜론 없이 1개만 생성):
-  SELECT LEFT(conts_ymd, 4) as 연도, COUNT(*) as 건수
-  FROM "f_projects" WHERE conts_klang_nm ILIKE '%키워드%'
-  GROUP BY LEFT(conts_ymd, 4) ORDER BY 연도 DESC
-
-## 테이블 관계 (JOIN 시 참고)
-- f_patents.documentid = f_patent_applicants.document_id
-- f_proposal_profile.sbjt_id = f_proposal_techclsf.sbjt_id
-
-## 출력
-SQL만 출력. 마크다운/설명 없이.
-"""
+ORDER BY 과제수 DESC LIMIT 20""",
+    },
+    {
+        "title": "연도별 동향 (trend_analysis)",
+        "trigger_keywords": ["동향", "추이", "트렌드"],
+        "sql": """SELECT LEFT(conts_ymd, 4) as 연도, COUNT(*) as 건수
+FROM "f_projects" WHERE conts_klang_nm ILIKE '%키워드%'
+GROUP BY LEFT(conts_ymd, 4) ORDER BY 연도 DESC""",
+    },
+]
 
 # SQL 생성 사용자 프롬프트 템플릿
 SQL_GENERATION_USER = """## 데이터베이스 스키마
@@ -81,6 +100,10 @@ SQL_GENERATION_USER = """## 데이터베이스 스키마
 벡터 검색 힌트가 있으면 해당 키워드와 document ID를 적극 활용하세요.
 """
 
+# 힌트 유무에 따른 사용자 프롬프트 템플릿 (import 시 1회 분리)
+_USER_WITH_HINTS = SQL_GENERATION_USER
+_USER_NO_HINTS = SQL_GENERATION_USER.replace("{hints_section}", "")
+
 # 결과 해석 시스템 프롬프트
 SQL_RESULT_INTERPRETATION_SYSTEM = """당신은 데이터 분석 전문가입니다.
 SQL 쿼리 결과를 분석하여 사용자에게 친절하게 설명합니다.
@@ -134,6 +157,40 @@ SQL 쿼리의 안전성을 검증합니다.
 """
 
 
+def select_sql_examples(question: str, top_k: int = 2) -> list:
+    """질문과 관련된 SQL 예시 선택
+
+    Args:
+        question: 사용자 질문
+        top_k: 최대 예시 수
+
+    Returns:
+        SQL_EXAMPLES 항목 리스트 (매칭 키워드 수 내림차순)
+    """
+    scored = []
+    for example in SQL_EXAMPLES:
+        hits = sum(1 for kw in example["trigger_keywords"] if kw in question)
+        if hits:
+            scored.append((hits, example))
+
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [example for _, example in scored[:top_k]]
+
+
+def format_sql_examples(examples: list) -> str:
+    """SQL 예시를 프롬프트 섹션으로 포맷팅"""
+    if not examples:
+        return ""
+
+    lines = ["## 참고 SQL 예시"]
+    for example in examples:
+        lines.append(f"### {example['title']}")
+        lines.append(example["sql"])
+        lines.append("")
+
+    return "\n".join(lines)
+
+
 def build_sql_generation_prompt(question: str, schema: str, sql_hints: str = None) -> tuple:
     """SQL 생성 프롬프트 구성
 
@@ -145,12 +202,20 @@ def build_sql_generation_prompt(question: str, schema: str, sql_hints: str = Non
     Returns:
         (system_prompt, user_prompt) 튜플
     """
-    # 힌트 섹션 생성
+    # 힌트 섹션 생성 (벡터 힌트 + 질문 관련 SQL 예시)
     hints_section = ""
     if sql_hints:
         hints_section = f"{sql_hints}\n\n"
 
-    user_prompt = SQL_GENERATION_USER.format(
+    examples_section = format_sql_examples(select_sql_examples(question))
+    if examples_section:
+        hints_section += f"{examples_section}\n"
+
+    if not hints_section:
+        user_prompt = _USER_NO_HINTS.format(schema=schema, question=question)
+        return SQL_GENERATION_SYSTEM, user_prompt
+
+    user_prompt = _USER_WITH_HINTS.format(
         schema=schema,
         hints_section=hints_section,
         question=question
@@ -224,7 +289,8 @@ def format_query_result(columns: list, rows: list, max_rows: int = 10) -> str:
 
 # 엔티티별 표준 컬럼 정의 (Phase 19/33: 실제 DB 컬럼 기반)
 # DB 스키마 조회 결과를 반영하여 정확한 컬럼명 사용
-ENTITY_COLUMNS = {
+# sql_template의 키워드 자리는 %(keyword)s (format_entity_sql로 리터럴 치환)
+_ENTITY_COLUMNS_RAW = {
     "patent": {
         "table": "f_patents",
         "join_table": None,  # Phase 72.1: JOIN 제거 (중복 방지)
@@ -237,7 +303,7 @@ ENTITY_COLUMNS = {
        p.ipc_main as IPC분류, LEFT(p.ptnaplc_ymd, 4) as 출원년도,
        p.ntcd as 등록국가, p.patent_frst_appn as 최초출원인
 FROM "f_patents" p
-WHERE (p.conts_klang_nm ILIKE '%{keyword}%' OR p.patent_frst_appn ILIKE '%{keyword}%')
+WHERE (p.conts_klang_nm ILIKE %(keyword)s OR p.patent_frst_appn ILIKE %(keyword)s)
 ORDER BY p.ptnaplc_ymd DESC
 LIMIT 10"""
     },
@@ -252,7 +318,7 @@ LIMIT 10"""
         "sql_template": """SELECT conts_id as 과제ID, conts_klang_nm as 과제명,
        ancm_yy as 공고연도, tot_rsrh_blgn_amt as 연구비, bucl_nm as 사업분류
 FROM "f_projects"
-WHERE conts_klang_nm ILIKE '%{keyword}%'
+WHERE conts_klang_nm ILIKE %(keyword)s
 LIMIT 10"""
     },
     "proposal": {
@@ -265,7 +331,7 @@ LIMIT 10"""
         "sql_template": """SELECT sbjt_id as 제안서ID, sbjt_nm as 제안서명,
        orgn_nm as 기관명, dvlp_gole as 개발목표, rsrh_expn as 연구비
 FROM "f_proposal_profile"
-WHERE sbjt_nm ILIKE '%{keyword}%'
+WHERE sbjt_nm ILIKE %(keyword)s
 LIMIT 10"""
     },
     "equip": {
@@ -284,7 +350,7 @@ LIMIT 10"""
         "sql_template": """SELECT conts_id as 장비ID, conts_klang_nm as 장비명,
        org_nm as 보유기관, conts_mclas_nm as 분야, equip_grp_lv2_nm as 장비분류, address_dosi as 지역
 FROM "f_equipments"
-WHERE (conts_klang_nm ILIKE '%{keyword}%' OR org_nm ILIKE '%{keyword}%')
+WHERE (conts_klang_nm ILIKE %(keyword)s OR org_nm ILIKE %(keyword)s)
 LIMIT 10"""
     },
     # Phase 48: evalp 두 가지 조회 방식
@@ -306,7 +372,7 @@ LIMIT 10"""
     STRING_AGG(eval_idx_nm || ' (' || COALESCE(eval_score, '-') || '점)', ' | ' ORDER BY eval_score DESC) as 평가항목,
     MAX(vlid_srt_ymd) as 연도
 FROM "f_ancm_evalp"
-WHERE (evalp_id ILIKE '%{keyword}%' OR ancm_nm ILIKE '%{keyword}%')
+WHERE (evalp_id ILIKE %(keyword)s OR ancm_nm ILIKE %(keyword)s)
   AND eval_idx_nm IS NOT NULL AND eval_idx_nm <> ''
 GROUP BY evalp_id
 ORDER BY MAX(vlid_srt_ymd) DESC NULLS LAST
@@ -326,7 +392,7 @@ LIMIT 10"""
     COALESCE(eval_score, '-') as 배점,
     COALESCE(eval_note, '-') as 비고
 FROM "f_ancm_evalp"
-WHERE (evalp_id ILIKE '%{keyword}%' OR ancm_nm ILIKE '%{keyword}%')
+WHERE (evalp_id ILIKE %(keyword)s OR ancm_nm ILIKE %(keyword)s)
   AND eval_idx_nm IS NOT NULL AND eval_idx_nm <> ''
 ORDER BY evalp_id, CAST(NULLIF(eval_score, '') AS INTEGER) DESC NULLS LAST
 LIMIT 50"""
@@ -341,7 +407,7 @@ LIMIT 50"""
         "sql_template": """SELECT ancm_id as 공고ID, ancm_tl_nm as 공고명,
        ancm_ymd as 공고일자, bucl_nm as 사업분류, prcnd_yn as 조건여부
 FROM "f_ancm_prcnd"
-WHERE ancm_tl_nm ILIKE '%{keyword}%' OR bucl_nm ILIKE '%{keyword}%'
+WHERE ancm_tl_nm ILIKE %(keyword)s OR bucl_nm ILIKE %(keyword)s
 LIMIT 10"""
     },
     "tech": {
@@ -353,14 +419,79 @@ LIMIT 10"""
         "aliases": ["기술코드", "기술명", "기술트리"],
         "sql_template": """SELECT tecl_cd as 기술코드, tecl_nm as 기술명, tecl_nm_tree as 기술트리
 FROM "f_proposal_techclsf"
-WHERE tecl_nm ILIKE '%{keyword}%'
+WHERE tecl_nm ILIKE %(keyword)s
 GROUP BY tecl_cd, tecl_nm, tecl_nm_tree
 LIMIT 10"""
     }
 }
 
-# 엔티티별 한글 라벨
-ENTITY_LABELS = {
+# 하위 호환용 읽기 전용 뷰
+ENTITY_COLUMNS = MappingProxyType(_ENTITY_COLUMNS_RAW)
+
+
+class EntityColumns(NamedTuple):
+    """엔티티별 SQL 구성 정보"""
+    table: str
+    columns: Tuple[str, ...]
+    aliases: Tuple[str, ...]
+    sql_template: str
+
+
+# 엔티티 필드를 엔티티 인덱스 기준 병렬 튜플로 보관 (SoA)
+_ENTITY_INDEX = {name: i for i, name in enumerate(_ENTITY_COLUMNS_RAW)}
+_TABLES: Tuple[str, ...] = tuple(v["table"] for v in _ENTITY_COLUMNS_RAW.values())
+_COLUMNS: Tuple[Tuple[str, ...], ...] = tuple(tuple(v["columns"]) for v in _ENTITY_COLUMNS_RAW.values())
+_ALIASES: Tuple[Tuple[str, ...], ...] = tuple(tuple(v["aliases"]) for v in _ENTITY_COLUMNS_RAW.values())
+_SQL_TEMPLATES: Tuple[str, ...] = tuple(v["sql_template"] for v in _ENTITY_COLUMNS_RAW.values())
+
+
+def get_entity(name: str) -> Optional[EntityColumns]:
+    """엔티티 SQL 구성 조회
+
+    Args:
+        name: 엔티티 타입 (patent, project 등)
+
+    Returns:
+        EntityColumns 또는 None (미정의 엔티티)
+    """
+    i = _ENTITY_INDEX.get(name)
+    if i is None:
+        return None
+    return EntityColumns(_TABLES[i], _COLUMNS[i], _ALIASES[i], _SQL_TEMPLATES[i])
+
+
+KEYWORD_PLACEHOLDER = "%(keyword)s"
+
+
+def _escape_like(keyword: str) -> str:
+    """LIKE 와일드카드(%, _)와 이스케이프 문자 이스케이프"""
+    return keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def format_entity_sql(entity_type: str, keyword: str) -> str:
+    """표시/로깅/LLM 힌트용 엔티티 SQL (키워드를 이스케이프된 리터럴로 치환)
+
+    키워드의 LIKE 와일드카드(%, _)는 이스케이프하고 작은따옴표는 이중화한다.
+
+    Args:
+        entity_type: 엔티티 타입 (patent, project 등)
+        keyword: 검색 키워드
+
+    Returns:
+        리터럴이 채워진 SQL 문자열
+
+    Raises:
+        ValueError: 정의되지 않은 엔티티 타입
+    """
+    entity = get_entity(entity_type)
+    if entity is None:
+        raise ValueError(f"Unknown entity type: {entity_type}")
+    literal = "'%" + _escape_like(keyword).replace("'", "''") + "%'"
+    return entity.sql_template.replace(KEYWORD_PLACEHOLDER, literal)
+
+
+# 엔티티별 한글 라벨 (읽기 전용)
+ENTITY_LABELS = MappingProxyType({
     "patent": "특허",
     "project": "연구과제",
     "proposal": "제안서",
@@ -369,7 +500,7 @@ ENTITY_LABELS = {
     "evalp_detail": "평가표 세부항목",  # Phase 48
     "ancm": "사업공고",
     "tech": "기술분류"
-}
+})
 
 
 # Phase 35.3: EXAMPLE_QUERIES 제거됨 (토큰 절약)
@@ -431,7 +562,7 @@ LIMIT 20""",
 
 # Phase 62: 분류체계 유형 매핑 (사용자 요청 → DB 코드)
 # f_proposal_techclsf 테이블의 cd_nm (분류체계명) 기반 정확한 매핑
-CLASSIFICATION_TYPE_MAPPING = {
+_CLASSIFICATION_TYPE_MAPPING_RAW = {
     # 신산업기술분류코드 - SAF006 (가장 많이 사용: 77,500건)
     "신산업기술분류": "SAF006",
     "신산업기술분류코드": "SAF006",
@@ -462,8 +593,20 @@ CLASSIFICATION_TYPE_MAPPING = {
     "적용분야": "SAF037",
 }
 
-# 분류체계 한글 라벨 (cd_nm 기반)
-CLASSIFICATION_TYPE_LABELS = {
+# 쿼리마다 조회되므로 키를 intern하고 읽기 전용 뷰로 공유
+CLASSIFICATION_TYPE_MAPPING = MappingProxyType({
+    sys.intern(keyword): sys.intern(code)
+    for keyword, code in _CLASSIFICATION_TYPE_MAPPING_RAW.items()
+})
+
+# SAF 코드 → 분류체계 키워드 역방향 조회 (import 시 1회 계산)
+CODE_TO_KEYWORDS = MappingProxyType({
+    code: tuple(k for k, c in CLASSIFICATION_TYPE_MAPPING.items() if c == code)
+    for code in dict.fromkeys(CLASSIFICATION_TYPE_MAPPING.values())
+})
+
+# 분류체계 한글 라벨 (cd_nm 기반, 읽기 전용)
+CLASSIFICATION_TYPE_LABELS = MappingProxyType({
     "SAF006": "신산업기술분류코드",
     "SAF002": "6T 기술분류",
     "SAF047": "국가과학기술표준분류(2018년)",
@@ -474,4 +617,4 @@ CLASSIFICATION_TYPE_LABELS = {
     "SAF048": "중점과학기술분류",
     "SAF036": "NTIS 과학기술분류",
     "SAF043": "국가기술지도분류",
-}
+})
@@ -6,10 +6,63 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import copy
 import pytest
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
 from typing import Generator
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="slow 마커 테스트(실제 LLM/워크플로우 호출)까지 실행",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """옵션/환경변수에 따라 수집 단계에서 테스트 skip
+
+    - 기본: slow 마커 테스트 skip (--runslow 지정 시 실행)
+    - SKIP_WORKFLOW=1: 워크플로우 의존 테스트 skip (LangGraph 로딩 생략)
+    - PATENT_AX_OFFLINE=1: 실제 외부 서비스를 호출하는 integration 테스트 skip (네트워크 타임아웃 대기 생략)
+    """
+    skip_slow = not config.getoption("--runslow")
+    skip_workflow = os.environ.get("SKIP_WORKFLOW")
+    offline = os.environ.get("PATENT_AX_OFFLINE")
+    if not (skip_slow or skip_workflow or offline):
+        return
+
+    slow_marker = pytest.mark.skip(reason="slow 테스트 생략 (--runslow로 실행)")
+    workflow_marker = pytest.mark.skip(reason="SKIP_WORKFLOW=1: 워크플로우 의존 테스트 생략")
+    offline_marker = pytest.mark.skip(reason="PATENT_AX_OFFLINE=1: 외부 서비스 연동 테스트 생략")
+    for item in items:
+        if skip_slow and item.get_closest_marker("slow"):
+            item.add_marker(slow_marker)
+        if skip_workflow:
+            uses_workflow = {"workflow", "workflow_agent", "warm_agent"} & set(getattr(item, "fixturenames", ()))
+            if uses_workflow or item.get_closest_marker("workflow"):
+                item.add_marker(workflow_marker)
+        if offline and item.get_closest_marker("integration"):
+            item.add_marker(offline_marker)
+
+
+# Patent-AX에서 사용하지 않아야 하는 모듈 (다중 도메인 매핑 - 특허 전용 전환 후 제거 대상)
+FORBIDDEN_MODULES = frozenset({"workflow.prompts.domain_mapping"})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _guard_forbidden_imports():
+    """세션 시작 시 sys.modules 스냅샷을 1회 저장하고, 세션 종료 시 테스트 실행 중 새로 import된 금지 모듈 검사
+
+    수집 단계에서 이미 로드된 모듈(예: 해당 모듈 전용 테스트)은 기준선으로 간주해 제외합니다.
+    """
+    baseline = frozenset(sys.modules)
+    yield
+    imported = (FORBIDDEN_MODULES & sys.modules.keys()) - baseline
+    assert not imported, f"금지된 모듈이 import됨: {sorted(imported)}"
+
+
 @pytest.fixture(scope="session")
 def workflow():
     """컴파일된 워크플로우 반환"""
@@ -26,6 +79,242 @@ def workflow_agent():
     return agent
 
 
+@pytest.fixture(scope="session")
+def warm_agent(workflow_agent):
+    """워밍업된 워크플로우 에이전트 (첫 호출 초기화 비용을 세션당 1회만 지불)"""
+    workflow_agent.chat(query="warmup")
+    workflow_agent.clear_history()
+    return workflow_agent
+
+
+@pytest.fixture(scope="session")
+def _state_cache():
+    """create_initial_state 결과 캐시 ((query, kwargs) → 기준 state)"""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def make_state(_state_cache):
+    """create_initial_state 대체 헬퍼 - 기준 state를 1회 생성 후 깊은 복사본 반환
+
+    테스트가 반환된 state를 수정해도 캐시된 기준 state에는 영향이 없습니다.
+    """
+    from workflow.state import create_initial_state
+
+    def _make_state(query: str, **kwargs):
+        key = (query, frozenset(kwargs.items()))
+        if key not in _state_cache:
+            _state_cache[key] = create_initial_state(query, **kwargs)
+        return copy.deepcopy(_state_cache[key])
+
+    return _make_state
+
+
+@dataclass(frozen=True)
+class DBConfig:
+    """PostgreSQL 접속 정보 (psycopg2.connect 키워드와 동일한 필드명)"""
+    host: str
+    port: int
+    database: str
+    user: str
+    password: str
+
+
+@pytest.fixture(scope="session")
+def config():
+    """외부 서비스 접속 설정 (.env 로드 후 세션당 1회 생성, 테스트 간 불변)"""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    return SimpleNamespace(
+        db=DBConfig(
+            host=os.getenv("DB_HOST", "localhost"),
+            port=int(os.getenv("DB_PORT", "5432")),
+            database=os.getenv("DB_NAME", "ax"),
+            user=os.getenv("DB_USER", "postgres"),
+            password=os.getenv("DB_PASSWORD", "postgres"),
+        ),
+        QDRANT_URL=os.getenv("QDRANT_URL", "http://210.109.80.106:6333"),
+        QDRANT_GRPC_PORT=int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+        QDRANT_COLLECTION=os.getenv("QDRANT_COLLECTION", "patents_v3_collection"),
+        VLLM_BASE_URL=os.getenv("VLLM_BASE_URL", "http://210.109.80.106:12288"),
+        KURE_API_URL=os.getenv("KURE_API_URL", "http://210.109.80.106:7000/api/embedding"),
+        CUGRAPH_API_URL=os.getenv("CUGRAPH_API_URL", "http://210.109.80.106:8000"),
+    )
+
+
+@pytest.fixture(scope="session")
+def pg_pool(config):
+    """PostgreSQL 커넥션 풀 (세션 전체 공유 - 테스트마다 연결/인증 반복 방지)"""
+    from psycopg2.pool import ThreadedConnectionPool
+
+    db_config = asdict(config.db)
+    # minconn=0: 실제 연결은 첫 getconn() 시점에 생성 (DB 장애가 fixture 생성 단계로 번지지 않음)
+    pool = ThreadedConnectionPool(0, 4, **db_config)
+    yield pool
+    pool.closeall()
+
+
+@pytest.fixture(scope="session")
+def pg_conn(pg_pool):
+    """풀에서 1회 빌려 세션 전체가 공유하는 PostgreSQL 연결 (세션 종료 시 반환)
+
+    조회 전용 테스트만 사용하므로 autocommit으로 설정 - 한 테스트의 쿼리 실패가
+    트랜잭션 중단(InFailedSqlTransaction)으로 이후 테스트에 전파되지 않음
+    """
+    conn = pg_pool.getconn()
+    conn.autocommit = True
+    yield conn
+    conn.autocommit = False
+    pg_pool.putconn(conn)
+
+
+@pytest.fixture(scope="session")
+def http():
+    """외부 서비스 호출용 공유 requests.Session (동일 호스트 TCP 연결 재사용, 일시 오류 재시도)"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield session
+    session.close()
+
+
+# 테스트에 필요한 서비스들이 정상인지 사전 확인 (서비스별 프로브: (정상 여부, 메시지) 반환)
+# 접속 정보는 세션 config fixture 하나에서 읽음 (URL/컬렉션명 중복 정의 방지)
+def _probe_postgresql(http, config):
+    from sql.db_connector import test_connection
+    return test_connection(), "PostgreSQL 접근 불가"
+
+
+def _probe_qdrant(http, config):
+    response = http.get(f"{config.QDRANT_URL}/collections/{config.QDRANT_COLLECTION}", timeout=5)
+    return response.status_code == 200, "Qdrant 접근 불가"
+
+
+def _probe_vllm(http, config):
+    response = http.get(f"{config.VLLM_BASE_URL}/health", timeout=5)
+    return response.status_code == 200, "vLLM 접근 불가"
+
+
+SERVICE_PROBES = {
+    "postgresql": _probe_postgresql,
+    "qdrant": _probe_qdrant,
+    "vllm": _probe_vllm,
+}
+
+
+def probe_services(http, config):
+    """서비스 프로브를 동시에 실행해 {서비스명: (정상 여부, 메시지)} 반환
+
+    전체 대기 시간이 가장 느린 서비스 하나로 수렴하며, 프로브 예외는 해당 서비스의 실패로 기록합니다.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(SERVICE_PROBES)) as executor:
+        futures = {name: executor.submit(probe, http, config) for name, probe in SERVICE_PROBES.items()}
+
+    status = {}
+    for name, future in futures.items():
+        try:
+            status[name] = future.result()
+        except Exception as e:
+            status[name] = (False, f"서비스 확인 실패: {str(e)}")
+    return status
+
+
+def _first_failure(status):
+    """SERVICE_PROBES 순서 기준 첫 번째 실패를 (False, 메시지)로, 모두 정상이면 (True, ...) 반환"""
+    for ok, message in status.values():
+        if not ok:
+            return False, message
+    return True, "모든 서비스 정상"
+
+
+def check_services_available(http, config):
+    """테스트 실행 전 필수 서비스 확인 (http: 세션 공유 requests.Session, config: 세션 접속 설정)
+
+    프로브를 동시에 실행해 전체 대기 시간이 가장 느린 서비스 하나로 수렴합니다.
+    실패 메시지는 SERVICE_PROBES 순서 기준 첫 번째 실패를 반환합니다.
+    """
+    return _first_failure(probe_services(http, config))
+
+
+@pytest.fixture(scope="session")
+def service_status(http, config):
+    """서비스별 프로브 결과 (세션당 1회 실행 후 services_check / vllm_check 가 공유)"""
+    return probe_services(http, config)
+
+
+@pytest.fixture(scope="session")
+def services_check(config, service_status):
+    """필수 서비스 확인 (config 접속 설정 기준 세션당 1회 프로브, 실패 시 의존 테스트 skip)"""
+    available, message = _first_failure(service_status)
+    if not available:
+        pytest.skip(
+            f"필수 서비스 접근 불가: {message} "
+            f"(QDRANT_URL={config.QDRANT_URL}, VLLM_BASE_URL={config.VLLM_BASE_URL})"
+        )
+    return available
+
+
+@pytest.fixture(scope="session")
+def vllm_check(service_status):
+    """vLLM만 필요한 테스트용 확인 (캐시된 프로브 결과 재사용, 접근 불가 시 skip)"""
+    available, message = service_status["vllm"]
+    if not available:
+        pytest.skip(f"vLLM 접근 불가: {message}")
+    return available
+
+
+@pytest.fixture(scope="session")
+def qdrant_client(config):
+    """gRPC 우선 QdrantClient (세션 공유, 호스트/REST 포트는 QDRANT_URL에서 추출)
+
+    REST(JSON) 대비 float32 벡터를 packed protobuf로 전송해 페이로드/인코딩 비용이 작습니다.
+    """
+    from urllib.parse import urlparse
+    from qdrant_client import QdrantClient
+
+    parsed = urlparse(config.QDRANT_URL)
+    client = QdrantClient(
+        host=parsed.hostname,
+        port=parsed.port or 6333,
+        grpc_port=config.QDRANT_GRPC_PORT,
+        prefer_grpc=True,
+        timeout=30,
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def patents_collection_info(qdrant_client, config):
+    """patents_v3_collection 메타데이터 (세션당 1회 조회)"""
+    return qdrant_client.get_collection(collection_name=config.QDRANT_COLLECTION)
+
+
+@pytest.fixture(scope="session")
+def qdrant_sample_point(config, http):
+    """patents_v3_collection 첫 번째 point (세션당 REST Scroll 1회, 벡터 제외) - 비어있으면 None"""
+    response = http.post(
+        f"{config.QDRANT_URL}/collections/{config.QDRANT_COLLECTION}/points/scroll",
+        json={"limit": 1, "with_vector": False},
+        timeout=10,
+    )
+    response.raise_for_status()
+    points = response.json()["result"]["points"]
+    return points[0] if points else None
+
+
 @pytest.fixture
 def sample_queries():
     """테스트용 샘플 쿼리"""
@@ -37,25 +326,31 @@ def sample_queries():
     }
 
 
+# mock_llm_response가 LLMClient에 주입하는 고정 응답 (모듈 로드 시 1회 정의)
+def _fake_llm_generate(*args, **kwargs):
+    return '{"query_type": "rag", "intent": "테스트", "entity_types": [], "keywords": [], "related_tables": []}'
+
+
+def _fake_llm_chat(*args, **kwargs):
+    return {
+        "choices": [{
+            "message": {
+                "content": "테스트 응답입니다."
+            }
+        }]
+    }
+
+
 @pytest.fixture
 def mock_llm_response(monkeypatch):
-    """LLM 응답 모킹"""
-    def mock_generate(*args, **kwargs):
-        return '{"query_type": "rag", "intent": "테스트", "entity_types": [], "keywords": [], "related_tables": []}'
-
-    def mock_chat(*args, **kwargs):
-        return {
-            "choices": [{
-                "message": {
-                    "content": "테스트 응답입니다."
-                }
-            }]
-        }
-
-    # LLMClient 모킹
+    """LLM 응답 모킹 - 실제 LLMClient 클래스의 메서드를 교체
+
+    클래스 속성을 교체하므로 이미 생성된 인스턴스와 `from llm.llm_client import LLMClient`로
+    가져간 모듈에도 적용됩니다.
+    """
     from llm.llm_client import LLMClient
-    monkeypatch.setattr(LLMClient, "generate", mock_generate)
-    monkeypatch.setattr(LLMClient, "chat", mock_chat)
+    monkeypatch.setattr(LLMClient, "generate", _fake_llm_generate)
+    monkeypatch.setattr(LLMClient, "chat", _fake_llm_chat)
 
 
 @pytest.fixture
@@ -4,15 +4,57 @@ FastAPI 헬스체크 엔드포인트 통합 테스트
 API 서버의 각 헬스체크 엔드포인트가 올바르게 동작하는지 검증합니다.
 """
 
+import asyncio
 import pytest
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import httpx
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 
 
+# 헬스체크 GET 엔드포인트별 응답 스키마 (필수 키 + 허용 값)
+HEALTH_STATUSES = ["healthy", "degraded", "unhealthy"]
+
+HEALTH_ENDPOINT_SCHEMAS = {
+    "/": {
+        "required": ["status", "service", "version"],
+        "allowed": {"status": ["ok"]},
+    },
+    "/health": {
+        "required": ["status"],
+        "allowed": {"status": ["healthy"]},
+    },
+    "/agent/health": {
+        "required": ["status", "llm", "agent_initialized"],
+        "allowed": {"status": HEALTH_STATUSES},
+    },
+    "/sql/health": {
+        "required": ["status", "database", "llm"],
+        "allowed": {"status": HEALTH_STATUSES},
+    },
+    "/collections": {
+        "required": ["total", "collections"],
+        "allowed": {},
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def health_responses():
+    """헬스체크 GET 엔드포인트 전체를 AsyncClient + asyncio.gather로 동시 요청 (모듈당 1회, {경로: 응답})"""
+    from api.main import app
+
+    async def fetch_all():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await asyncio.gather(*(client.get(path) for path in HEALTH_ENDPOINT_SCHEMAS))
+
+    return dict(zip(HEALTH_ENDPOINT_SCHEMAS, asyncio.run(fetch_all())))
+
+
 class TestAPIHealthEndpoints:
     """FastAPI 헬스체크 엔드포인트 테스트 - TestClient 사용"""
 
@@ -22,94 +64,42 @@ class TestAPIHealthEndpoints:
         from api.main import app
         return TestClient(app)
 
-    def test_root_endpoint(self, client):
-        """GET / 기본 상태 확인"""
-        response = client.get("/")
-
-        # HTTP 상태 코드
-        assert response.status_code == 200
-
-        # 응답 데이터
-        data = response.json()
-        assert data.get("status") == "ok"
-        assert "service" in data
-        assert "version" in data
-
-        print(f"✓ Root 엔드포인트 정상: {data}")
-
-    def test_health_endpoint(self, client):
-        """GET /health 기본 헬스체크"""
-        response = client.get("/health")
+    @pytest.mark.parametrize("path", list(HEALTH_ENDPOINT_SCHEMAS))
+    def test_health_endpoint(self, health_responses, path):
+        """헬스체크 GET 엔드포인트 응답 스키마 확인 (동시 요청 응답 재사용, 엔드포인트별 개별 테스트)"""
+        schema = HEALTH_ENDPOINT_SCHEMAS[path]
+        response = health_responses[path]
 
         # HTTP 상태 코드
-        assert response.status_code == 200
+        assert response.status_code == 200, f"{path}: HTTP {response.status_code}"
 
         # 응답 데이터
         data = response.json()
-        assert data.get("status") == "healthy"
-
-        print(f"✓ Health 엔드포인트 정상: {data}")
+        for key in schema["required"]:
+            assert key in data, f"{path}: '{key}' 누락"
+        for key, allowed in schema["allowed"].items():
+            assert data[key] in allowed, f"{path}: {key}={data[key]!r}"
 
-    def test_agent_health_endpoint(self, client):
-        """GET /agent/health LLM 연결 확인"""
-        response = client.get("/agent/health")
-
-        # HTTP 상태 코드
-        assert response.status_code == 200
-
-        # 응답 데이터
-        data = response.json()
-        assert "status" in data
-        assert "llm" in data
-        assert "agent_initialized" in data
+        print(f"✓ {path} 엔드포인트 정상: {data}")
 
-        # 상태는 healthy 또는 degraded 또는 unhealthy
-        assert data["status"] in ["healthy", "degraded", "unhealthy"]
-
-        print(f"✓ Agent health 엔드포인트 정상: {data}")
-
-    def test_sql_health_endpoint(self, client):
-        """GET /sql/health DB + LLM 연결 확인"""
-        response = client.get("/sql/health")
-
-        # HTTP 상태 코드
-        assert response.status_code == 200
-
-        # 응답 데이터
-        data = response.json()
-        assert "status" in data
-        assert "database" in data
-        assert "llm" in data
-
-        # 상태는 healthy 또는 degraded 또는 unhealthy
-        assert data["status"] in ["healthy", "degraded", "unhealthy"]
+    def test_sql_health_connected(self, health_responses):
+        """GET /sql/health - healthy 상태면 database와 llm이 connected"""
+        sql_health = health_responses["/sql/health"].json()
 
         # 실제 환경에서는 database와 llm이 connected여야 함
-        if data["status"] == "healthy":
-            assert data["database"] == "connected"
-            assert data["llm"] == "connected"
+        if sql_health["status"] == "healthy":
+            assert sql_health["database"] == "connected"
+            assert sql_health["llm"] == "connected"
 
-        print(f"✓ SQL health 엔드포인트 정상: {data}")
-
-    def test_collections_endpoint(self, client):
-        """GET /collections 컬렉션 목록 조회"""
-        response = client.get("/collections")
-
-        # HTTP 상태 코드
-        assert response.status_code == 200
-
-        # 응답 데이터
-        data = response.json()
-        assert "total" in data
-        assert "collections" in data
-        assert isinstance(data["collections"], list)
+    def test_collections_include_patents(self, health_responses):
+        """GET /collections - patents 컬렉션 포함"""
+        collections = health_responses["/collections"].json()
 
         # Patent-AX는 patents 컬렉션만 있어야 함
-        collection_names = [c["name"] for c in data["collections"]]
+        assert isinstance(collections["collections"], list)
+        collection_names = [c["name"] for c in collections["collections"]]
         assert "patents" in collection_names
 
-        print(f"✓ Collections 엔드포인트 정상: {data['total']}개 컬렉션")
-
     def test_workflow_analyze_endpoint(self, client):
         """POST /workflow/analyze 쿼리 분석 엔드포인트"""
         response = client.post(
@@ -246,6 +236,7 @@ class TestAPISearchEndpoints:
             print(f"⚠ 검색 실패 (서비스 접근 불가): HTTP {response.status_code}")
 
 
+@pytest.mark.workflow
 class TestWorkflowEndpoints:
     """Workflow 엔드포인트 테스트"""
 
@@ -7,9 +7,26 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pytest
+from functools import lru_cache
+from typing import Any, Dict
+
 from workflow.graph import run_workflow, get_workflow_agent, create_workflow
 
 
+@lru_cache(maxsize=128)
+def _cached_workflow(query: str, options: tuple) -> Dict[str, Any]:
+    return run_workflow(query=query, **dict(options))
+
+
+def run_workflow_cached(query: str, **options) -> Dict[str, Any]:
+    """결정적 쿼리용 run_workflow 결과 캐시 (같은 프로세스에서 동일 쿼리 재실행 생략)
+
+    반환 dict는 테스트 간 공유되므로 읽기 전용으로 사용합니다.
+    응답 시간 측정 테스트는 캐시를 거치지 않습니다 (warm_agent 사용).
+    """
+    return _cached_workflow(query, tuple(sorted(options.items())))
+
+
 class TestWorkflowCreation:
     """워크플로우 생성 테스트"""
 
@@ -29,18 +46,20 @@ class TestWorkflowCreation:
 class TestSimpleQueries:
     """간단한 쿼리 E2E 테스트"""
 
-    def test_greeting(self):
+    def test_greeting(self, warm_agent):
         """인사말 테스트"""
-        result = run_workflow(query="안녕하세요")
+        result = warm_agent.chat(query="안녕하세요")
+        warm_agent.clear_history()
 
         assert result is not None
         assert result.get("query_type") == "simple"
         assert result.get("response") is not None
         assert len(result.get("response", "")) > 0
 
-    def test_help_request(self):
+    def test_help_request(self, warm_agent):
         """도움말 요청 테스트"""
-        result = run_workflow(query="도움말")
+        result = warm_agent.chat(query="도움말")
+        warm_agent.clear_history()
 
         assert result is not None
         assert result.get("query_type") == "simple"
@@ -52,7 +71,7 @@ class TestSQLQueries:
     @pytest.mark.slow
     def test_sql_query_patents(self):
         """특허 조회 테스트"""
-        result = run_workflow(query="특허 5개 알려줘")
+        result = run_workflow_cached(query="특허 5개 알려줘")
 
         assert result is not None
         # query_type이 sql이거나 분석 결과에 따라 다를 수 있음
@@ -61,7 +80,7 @@ class TestSQLQueries:
     @pytest.mark.slow
     def test_sql_query_projects(self):
         """과제 조회 테스트"""
-        result = run_workflow(query="연구과제 목록 3개")
+        result = run_workflow_cached(query="연구과제 목록 3개")
 
         assert result is not None
         assert result.get("response") is not None
@@ -73,7 +92,7 @@ class TestRAGQueries:
     @pytest.mark.slow
     def test_rag_query_trend(self):
         """연구 동향 쿼리 테스트"""
-        result = run_workflow(query="인공지능 연구 동향에 대해 알려줘")
+        result = run_workflow_cached(query="인공지능 연구 동향에 대해 알려줘")
 
         assert result is not None
         assert result.get("response") is not None
@@ -85,7 +104,7 @@ class TestHybridQueries:
     @pytest.mark.slow
     def test_hybrid_query(self):
         """하이브리드 쿼리 테스트"""
-        result = run_workflow(query="AI 관련 특허와 연구과제를 연결해서 설명해줘")
+        result = run_workflow_cached(query="AI 관련 특허와 연구과제를 연결해서 설명해줘")
 
         assert result is not None
         assert result.get("response") is not None
@@ -128,18 +147,20 @@ class TestWorkflowAgent:
 class TestErrorHandling:
     """에러 처리 테스트"""
 
-    def test_empty_query(self):
+    def test_empty_query(self, warm_agent):
         """빈 쿼리 처리 테스트"""
-        result = run_workflow(query="")
+        result = warm_agent.chat(query="")
+        warm_agent.clear_history()
 
         assert result is not None
         # 에러가 있거나 기본 응답이 있어야 함
         assert result.get("response") is not None or result.get("error") is not None
 
-    def test_very_long_query(self):
+    def test_very_long_query(self, warm_agent):
         """매우 긴 쿼리 처리 테스트"""
         long_query = "테스트 " * 1000
-        result = run_workflow(query=long_query)
+        result = warm_agent.chat(query=long_query)
+        warm_agent.clear_history()
 
         assert result is not None
 
@@ -147,9 +168,10 @@ class TestErrorHandling:
 class TestPerformance:
     """성능 테스트"""
 
-    def test_simple_query_performance(self):
-        """간단한 쿼리 응답 시간 테스트"""
-        result = run_workflow(query="안녕")
+    def test_simple_query_performance(self, warm_agent):
+        """간단한 쿼리 응답 시간 테스트 (워밍업 이후 정상 상태 지연 측정)"""
+        result = warm_agent.chat(query="안녕")
+        warm_agent.clear_history()
 
         # 간단한 쿼리는 10초 이내 응답
         assert result.get("elapsed_ms", float("inf")) < 10000
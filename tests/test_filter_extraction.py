@@ -15,6 +15,7 @@ from workflow.prompts.filter_extraction import (
     extract_preference_keywords,
     extract_entity_name,
     format_filters_for_prompt,
+    clear_caches,
     FilterConditions
 )
 
@@ -154,6 +155,29 @@ class TestFormatFiltersForPrompt:
         assert "추출된 필터 조건 없음" in result
 
 
+class TestExtractionCache:
+    """추출 결과 캐시 테스트"""
+
+    def test_cached_lists_not_shared(self):
+        """캐시된 결과를 수정해도 다음 호출에 영향 없음"""
+        query = "{전력반도체} KR 여성기업 특허"
+        first = extract_filter_conditions(query)
+        first.country_codes.append("US")
+        first.preference_keywords.clear()
+
+        second = extract_filter_conditions(query)
+        assert second.country_codes == ["KR"]
+        assert "여성기업" in second.preference_keywords
+
+    def test_clear_caches(self):
+        """캐시 초기화 후에도 동일 결과"""
+        query = "미국 특허 상위 20개"
+        before = extract_filter_conditions(query)
+        clear_caches()
+        after = extract_filter_conditions(query)
+        assert before == after
+
+
 class TestPhase16Queries:
     """Phase 16 15개 질의 필터 추출 테스트"""
 
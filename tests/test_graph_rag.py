@@ -0,0 +1,50 @@
+"""
+graph_rag 단위 테스트 (외부 서비스 호출 없음)
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from graph import graph_rag
+from graph.graph_rag import QdrantSearcher, clear_embedding_cache
+
+
+@pytest.fixture
+def kure_post(monkeypatch):
+    """KURE API POST를 대체하는 Mock (캐시 초기화 후 설치)"""
+    clear_embedding_cache()
+    response = MagicMock()
+    response.json.return_value = {"embedding": [0.1, 0.2, 0.3]}
+    post = MagicMock(return_value=response)
+    monkeypatch.setattr(graph_rag.requests, "post", post)
+    yield post
+    clear_embedding_cache()
+
+
+class TestEmbeddingCache:
+    """QdrantSearcher.get_embedding 캐시 테스트"""
+
+    def test_repeated_text_hits_cache(self, kure_post):
+        """동일 텍스트 재요청 시 KURE API를 다시 호출하지 않음"""
+        searcher = QdrantSearcher(kure_api="http://kure.test/api/embedding")
+
+        first = searcher.get_embedding("양자컴퓨터 특허")
+        second = searcher.get_embedding("양자컴퓨터 특허")
+
+        assert first == second == [0.1, 0.2, 0.3]
+        assert first is not second  # 호출자별 독립 리스트
+        assert kure_post.call_count == 1
+
+    def test_failure_not_cached(self, kure_post):
+        """요청 실패는 캐시되지 않고 다음 호출에서 재시도"""
+        searcher = QdrantSearcher(kure_api="http://kure.test/api/embedding")
+        response = kure_post.return_value
+        kure_post.side_effect = [requests.ConnectionError("down"), response]
+
+        assert searcher.get_embedding("반도체 특허") is None
+        assert searcher.get_embedding("반도체 특허") == [0.1, 0.2, 0.3]
+        assert kure_post.call_count == 2
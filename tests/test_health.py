@@ -6,43 +6,75 @@
 
 import pytest
 import os
-import sys
-import psycopg2
-import requests
-from qdrant_client import QdrantClient
-from typing import Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Dict
 
-# .env 파일 로드
-from dotenv import load_dotenv
-load_dotenv()
+# NOTE: psycopg2 / qdrant_client / requests / numpy 는 fixture·테스트 내부에서 import
+# (헬스체크를 실행하지 않는 단위 테스트 수집 시 import 비용 회피)
 
+EMBEDDING_TEST_TEXTS = ("인공지능 기반 반도체 제조 기술", "딥러닝 연구", "특허 출원")
+EMBEDDING_DIM = 1024
 
-class TestExternalServices:
-    """외부 서비스 헬스체크 테스트 - 실제 서비스에 연결"""
 
-    def test_postgresql_connection(self):
-        """PostgreSQL 연결 및 특허 테이블 확인"""
-        db_config = {
-            "host": os.getenv("DB_HOST", "localhost"),
-            "port": os.getenv("DB_PORT", "5432"),
-            "database": os.getenv("DB_NAME", "ax"),
-            "user": os.getenv("DB_USER", "postgres"),
-            "password": os.getenv("DB_PASSWORD", "postgres"),
-        }
+@pytest.fixture(scope="session")
+def dummy_query_vector():
+    """검색용 더미 벡터 (1024-dim, 모두 0.1) - 연속 float32 배열로 1회만 생성"""
+    import numpy as np
+    return np.full(EMBEDDING_DIM, 0.1, dtype=np.float32)
 
-        # DB 연결 테스트
-        conn = psycopg2.connect(**db_config)
-        cursor = conn.cursor()
 
-        # f_patents 테이블 확인
+# ============================================================================
+# 헬스체크 프로브 (세션 시작 시 병렬 실행 후 결과 캐시)
+# ============================================================================
+
+def _count_patent_rows(pool) -> Dict[str, int]:
+    """특허 / 출원인 테이블 행 수 조회 (풀에서 빌린 연결 사용)"""
+    conn = pool.getconn()
+    try:
+        cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM f_patents")
         patent_count = cursor.fetchone()[0]
-
-        # f_patent_applicants 테이블 확인
         cursor.execute("SELECT COUNT(*) FROM f_patent_applicants")
         applicant_count = cursor.fetchone()[0]
+        return {"f_patents": patent_count, "f_patent_applicants": applicant_count}
+    finally:
+        conn.rollback()
+        pool.putconn(conn)
+
+
+@pytest.fixture(scope="session")
+def health_probes(config, pg_pool, http) -> Dict[str, Future]:
+    """독립적인 외부 서비스 프로브를 동시에 실행
+
+    전체 소요 시간이 각 타임아웃의 합이 아닌 가장 느린 프로브 하나로 수렴합니다.
+    각 테스트는 future.result()로 결과를 받으며, 프로브 예외는 그대로 재발생합니다.
+    """
+    kure_url = config.KURE_API_URL
+    kure_health_url = kure_url.replace("/api/embedding", "/health")
+    probes = {
+        "postgresql": partial(_count_patent_rows, pg_pool),
+        "vllm": partial(http.get, f"{config.VLLM_BASE_URL}/health", timeout=5),
+        "kure": partial(http.get, kure_health_url, timeout=5),
+    }
+    # KURE API는 단건(text) 요청만 지원 → 텍스트별 요청을 다른 프로브와 함께 동시 실행
+    for i, text in enumerate(EMBEDDING_TEST_TEXTS):
+        probes[f"embedding_{i}"] = partial(http.post, kure_url, json={"text": text}, timeout=30)
 
-        conn.close()
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = {name: executor.submit(probe) for name, probe in probes.items()}
+
+    return futures
+
+
+class TestExternalServices:
+    """외부 서비스 헬스체크 테스트 - 실제 서비스에 연결"""
+
+    def test_postgresql_connection(self, health_probes):
+        """PostgreSQL 연결 및 특허 테이블 확인"""
+        row_counts = health_probes["postgresql"].result()
+        patent_count = row_counts.get("f_patents", 0)
+        applicant_count = row_counts.get("f_patent_applicants", 0)
 
         # 검증
         assert patent_count > 1_000_000, f"특허 데이터 부족: {patent_count} (예상: > 1M)"
@@ -50,15 +82,12 @@ class TestExternalServices:
 
         print(f"✓ PostgreSQL 연결 성공: f_patents={patent_count:,}, f_patent_applicants={applicant_count:,}")
 
-    def test_qdrant_collection_exists(self):
+    def test_qdrant_collection_exists(self, config, patents_collection_info):
         """Qdrant patents_v3_collection 존재 및 point 수 확인"""
-        qdrant_url = os.getenv("QDRANT_URL", "http://210.109.80.106:6333")
-        collection_name = "patents_v3_collection"
-
-        client = QdrantClient(url=qdrant_url, timeout=10)
+        collection_name = config.QDRANT_COLLECTION
 
-        # 컬렉션 정보 조회
-        collection_info = client.get_collection(collection_name=collection_name)
+        # 컬렉션 정보 (세션 fixture에서 1회 조회)
+        collection_info = patents_collection_info
 
         points_count = collection_info.points_count
         vectors_count = collection_info.vectors_count or 0  # None 처리
@@ -68,27 +97,25 @@ class TestExternalServices:
 
         print(f"✓ Qdrant 연결 성공: {collection_name} - {points_count:,} points, vectors_count={vectors_count}")
 
-    def test_vllm_service_health(self):
+    def test_vllm_service_health(self, config, health_probes):
         """vLLM 서비스 응답 확인"""
-        vllm_url = os.getenv("VLLM_BASE_URL", "http://210.109.80.106:12288")
-        health_endpoint = f"{vllm_url}/health"
+        vllm_url = config.VLLM_BASE_URL
 
         # Health check
-        response = requests.get(health_endpoint, timeout=5)
+        response = health_probes["vllm"].result()
 
         # 검증
         assert response.status_code == 200, f"vLLM 서비스 응답 실패: HTTP {response.status_code}"
 
         print(f"✓ vLLM 서비스 정상: {vllm_url}")
 
-    def test_kure_api_health(self):
+    def test_kure_api_health(self, config, health_probes):
         """KURE 임베딩 API 응답 확인"""
-        kure_url = os.getenv("KURE_API_URL", "http://210.109.80.106:7000/api/embedding")
         # KURE health는 7000/health (API gateway)
-        gateway_health_url = kure_url.replace("/api/embedding", "/health")
+        gateway_health_url = config.KURE_API_URL.replace("/api/embedding", "/health")
 
         # Health check
-        response = requests.get(gateway_health_url, timeout=5)
+        response = health_probes["kure"].result()
 
         # 검증
         assert response.status_code == 200, f"KURE API 응답 실패: HTTP {response.status_code}"
@@ -108,21 +135,21 @@ class TestExternalServices:
         print(f"  Services: {services}")
 
     @pytest.mark.skip(reason="cuGraph service currently unreachable (포트 8000)")
-    def test_cugraph_health(self):
+    def test_cugraph_health(self, config, http):
         """cuGraph 서비스 상태 (현재 비활성화)"""
-        cugraph_url = os.getenv("CUGRAPH_API_URL", "http://210.109.80.106:8000")
+        cugraph_url = config.CUGRAPH_API_URL
         health_endpoint = f"{cugraph_url}/health"
 
         # Health check
-        response = requests.get(health_endpoint, timeout=5)
+        response = http.get(health_endpoint, timeout=5)
 
         # 검증
         assert response.status_code == 200, f"cuGraph 서비스 응답 실패: HTTP {response.status_code}"
 
         print(f"✓ cuGraph 서비스 정상: {cugraph_url}")
 
-    def test_all_env_vars_loaded(self):
-        """필수 환경변수 로드 확인"""
+    def test_all_env_vars_loaded(self, config):
+        """필수 환경변수 로드 확인 (config fixture가 .env 로드)"""
         required_vars = {
             "DB_HOST": "localhost",
             "DB_NAME": "ax",
@@ -150,39 +177,28 @@ class TestExternalServices:
 class TestDatabaseSchema:
     """데이터베이스 스키마 검증"""
 
-    def test_patents_table_schema(self):
+    def test_patents_table_schema(self, pg_conn):
         """f_patents 테이블 스키마 확인"""
-        db_config = {
-            "host": os.getenv("DB_HOST", "localhost"),
-            "port": os.getenv("DB_PORT", "5432"),
-            "database": os.getenv("DB_NAME", "ax"),
-            "user": os.getenv("DB_USER", "postgres"),
-            "password": os.getenv("DB_PASSWORD", "postgres"),
-        }
-
-        conn = psycopg2.connect(**db_config)
-        cursor = conn.cursor()
+        cursor = pg_conn.cursor()
 
-        # 테이블 존재 확인
+        # 테이블 존재 + 컬럼 목록을 한 번의 왕복으로 조회
         cursor.execute("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_schema = 'public'
-                AND table_name = 'f_patents'
-            )
+            SELECT
+                EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_schema = 'public'
+                    AND table_name = 'f_patents'
+                ),
+                ARRAY(
+                    SELECT column_name::text
+                    FROM information_schema.columns
+                    WHERE table_schema = 'public'
+                    AND table_name = 'f_patents'
+                )
         """)
-        exists = cursor.fetchone()[0]
+        exists, columns = cursor.fetchone()
         assert exists, "f_patents 테이블이 존재하지 않음"
 
-        # 핵심 컬럼 존재 확인
-        cursor.execute("""
-            SELECT column_name
-            FROM information_schema.columns
-            WHERE table_schema = 'public'
-            AND table_name = 'f_patents'
-        """)
-        columns = [row[0] for row in cursor.fetchall()]
-
         # 실제 Patent-AX 스키마에 맞는 컬럼명
         required_columns = [
             "conts_id",  # 콘텐츠 ID
@@ -193,24 +209,13 @@ class TestDatabaseSchema:
 
         missing_columns = [col for col in required_columns if col not in columns]
 
-        conn.close()
-
         assert len(missing_columns) == 0, f"필수 컬럼 누락: {missing_columns}"
 
         print(f"✓ f_patents 테이블 스키마 정상: {len(columns)}개 컬럼")
 
-    def test_applicants_table_schema(self):
+    def test_applicants_table_schema(self, pg_conn):
         """f_patent_applicants 테이블 스키마 확인"""
-        db_config = {
-            "host": os.getenv("DB_HOST", "localhost"),
-            "port": os.getenv("DB_PORT", "5432"),
-            "database": os.getenv("DB_NAME", "ax"),
-            "user": os.getenv("DB_USER", "postgres"),
-            "password": os.getenv("DB_PASSWORD", "postgres"),
-        }
-
-        conn = psycopg2.connect(**db_config)
-        cursor = conn.cursor()
+        cursor = pg_conn.cursor()
 
         # 테이블 존재 확인
         cursor.execute("""
@@ -222,8 +227,6 @@ class TestDatabaseSchema:
         """)
         exists = cursor.fetchone()[0]
 
-        conn.close()
-
         assert exists, "f_patent_applicants 테이블이 존재하지 않음"
 
         print(f"✓ f_patent_applicants 테이블 존재 확인")
@@ -232,45 +235,40 @@ class TestDatabaseSchema:
 class TestServiceIntegration:
     """서비스 간 통합 테스트"""
 
-    def test_embedding_generation(self):
-        """KURE API를 통한 임베딩 생성 테스트"""
-        kure_url = os.getenv("KURE_API_URL", "http://210.109.80.106:7000/api/embedding")
-
-        # 테스트 텍스트
-        test_text = "인공지능 기반 반도체 제조 기술"
+    def test_embedding_generation(self, health_probes):
+        """KURE API를 통한 임베딩 생성 테스트 (여러 텍스트 → (N, 1024) 행렬로 일괄 검증)"""
+        import numpy as np
 
-        # 임베딩 생성 요청
-        response = requests.post(
-            kure_url,
-            json={"text": test_text},
-            timeout=30
-        )
+        responses = [health_probes[f"embedding_{i}"].result() for i in range(len(EMBEDDING_TEST_TEXTS))]
 
         # 검증
-        assert response.status_code == 200, f"임베딩 생성 실패: HTTP {response.status_code}"
+        for response in responses:
+            assert response.status_code == 200, f"임베딩 생성 실패: HTTP {response.status_code}"
 
-        data = response.json()
-        embedding = data.get("embedding")
+        vectors = [response.json().get("embedding") for response in responses]
+        assert all(v is not None for v in vectors), "임베딩 벡터 없음"
 
-        assert embedding is not None, "임베딩 벡터 없음"
-        assert len(embedding) == 1024, f"임베딩 차원 불일치: {len(embedding)} (예상: 1024)"
+        embeddings = np.asarray(vectors, dtype=np.float32)
+        expected_shape = (len(EMBEDDING_TEST_TEXTS), EMBEDDING_DIM)
+        assert embeddings.shape == expected_shape, f"임베딩 차원 불일치: {embeddings.shape} (예상: {expected_shape})"
 
-        print(f"✓ 임베딩 생성 성공: {len(embedding)}-dim vector")
+        # 배치 코사인 유사도 (정규화 후 행렬곱 1회) - 영벡터/비정상 값 검출
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        assert np.all(norms > 0), "영벡터 임베딩 존재"
+        unit = embeddings / norms
+        similarity = unit @ unit.T
+        assert np.allclose(np.diag(similarity), 1.0, atol=1e-3), "코사인 유사도 계산 이상"
 
-    def test_qdrant_vector_search(self):
-        """Qdrant 벡터 검색 테스트"""
-        qdrant_url = os.getenv("QDRANT_URL", "http://210.109.80.106:6333")
-        collection_name = "patents_v3_collection"
+        print(f"✓ 임베딩 생성 성공: {embeddings.shape[0]}개 x {embeddings.shape[1]}-dim")
 
-        client = QdrantClient(url=qdrant_url, timeout=30)
-
-        # 더미 벡터로 검색 (1024-dim, 모두 0.1)
-        dummy_vector = [0.1] * 1024
+    def test_qdrant_vector_search(self, config, qdrant_client, dummy_query_vector):
+        """Qdrant 벡터 검색 테스트"""
+        collection_name = config.QDRANT_COLLECTION
 
-        # 검색 실행
-        search_result = client.search(
+        # 더미 벡터로 검색 (세션 fixture의 float32 배열 재사용)
+        search_result = qdrant_client.search(
             collection_name=collection_name,
-            query_vector=dummy_vector,
+            query_vector=dummy_query_vector,
             limit=5
         )
 
@@ -9,7 +9,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 
 from workflow.state import (
     AgentState, create_initial_state,
@@ -22,6 +22,37 @@ from workflow.errors import (
 )
 
 
+@pytest.fixture(scope="class")
+def patched_llm():
+    """analyzer/generator의 get_llm_client를 클래스당 1회만 패치 (공유 Mock LLM 반환)
+
+    spec=LLMClient로 실제 클라이언트에 없는 속성 접근은 AttributeError로 드러납니다.
+    """
+    from llm.llm_client import LLMClient
+
+    shared_llm = MagicMock(spec=LLMClient)
+    with patch('workflow.nodes.analyzer.get_llm_client', return_value=shared_llm), \
+            patch('workflow.nodes.generator.get_llm_client', return_value=shared_llm):
+        yield shared_llm
+
+
+@pytest.fixture
+def mock_llm(patched_llm):
+    """공유 Mock LLM (테스트 종료 시 return_value/side_effect 초기화)"""
+    yield patched_llm
+    patched_llm.reset_mock(return_value=True, side_effect=True)
+
+
+# 리듀서 테스트용 메시지 (모듈 로드 시 1회 생성, 테스트에서는 얕은 복사로 사용)
+_EXISTING_MESSAGES = [ChatMessage(role="user", content=str(i)) for i in range(15)]
+_NEW_MESSAGES = [ChatMessage(role="assistant", content=str(i)) for i in range(10)]
+
+# 노드 테스트용 가짜 검색/SQL 결과 (테스트에서 읽기 전용으로 사용, 리스트는 테스트마다 새로 생성)
+_RESULT_PROJECT = SearchResult("id1", "name1", "project", 0.9)
+_RESULT_PATENT = SearchResult("id1", "AI 특허", "patent", 0.9)
+_SQL_OK = SQLQueryResult(success=True, row_count=5)
+
+
 class TestHistoryReducer:
     """대화 기록 리듀서 테스트"""
 
@@ -39,18 +70,18 @@ class TestHistoryReducer:
 
     def test_truncate_at_max(self):
         """최대 길이 초과 시 잘림"""
-        existing = [ChatMessage(role="user", content=f"{i}") for i in range(15)]
-        new = [ChatMessage(role="assistant", content=f"{i}") for i in range(10)]
+        existing = _EXISTING_MESSAGES[:]
+        new = _NEW_MESSAGES[:]
         result = history_reducer(existing, new)
         assert len(result) == MAX_HISTORY_LENGTH
 
     def test_keeps_recent(self):
         """최신 기록 유지"""
-        existing = [ChatMessage(role="user", content=f"old_{i}") for i in range(15)]
-        new = [ChatMessage(role="assistant", content=f"new_{i}") for i in range(10)]
+        existing = _EXISTING_MESSAGES[:]
+        new = _NEW_MESSAGES[:]
         result = history_reducer(existing, new)
         # 마지막 요소가 new 리스트의 마지막이어야 함
-        assert result[-1].content == "new_9"
+        assert result[-1] is _NEW_MESSAGES[-1]
 
     def test_none_handling(self):
         """None 입력 처리"""
@@ -145,26 +176,23 @@ class TestAnalyzerNode:
         result = _check_simple_query("특허 10개 알려줘")
         assert result is None
 
-    def test_empty_query_handling(self):
+    def test_empty_query_handling(self, make_state):
         """빈 쿼리 처리"""
         from workflow.nodes.analyzer import analyze_query
 
-        state = create_initial_state(query="")
+        state = make_state(query="")
         result = analyze_query(state)
 
         assert result["query_type"] == "simple"
         assert "error" in result or result["query_intent"] != ""
 
-    @patch('workflow.nodes.analyzer.get_llm_client')
-    def test_llm_failure_fallback(self, mock_llm_getter):
+    def test_llm_failure_fallback(self, mock_llm, make_state):
         """LLM 실패 시 폴백"""
         from workflow.nodes.analyzer import analyze_query
 
-        mock_llm = Mock()
         mock_llm.generate.side_effect = Exception("LLM 연결 실패")
-        mock_llm_getter.return_value = mock_llm
 
-        state = create_initial_state(query="테스트 질문")
+        state = make_state(query="테스트 질문")
         result = analyze_query(state)
 
         # 에러가 있어도 상태는 반환되어야 함
@@ -174,48 +202,49 @@ class TestAnalyzerNode:
 class TestRAGRetrieverNode:
     """RAG Retriever 노드 테스트"""
 
-    def test_strategy_selection_vector(self):
-        """벡터(의미) 검색 전략 선택"""
+    @pytest.mark.parametrize("query, intent, expected", [
+        ("인공지능 연구 동향", "인공지능 연구 동향 파악", "VECTOR_ONLY"),  # 벡터(의미) 검색
+        ("과제번호 검색", "특정 과제 번호로 검색", "GRAPH_ENHANCED"),  # 그래프 확장 검색
+        ("연구 네트워크", "연구자 간 협력 네트워크 분석", "GRAPH_ONLY"),  # 그래프 탐색
+    ], ids=["vector", "graph_enhanced", "graph_only"])
+    def test_strategy_selection(self, make_state, query, intent, expected):
+        """질의 의도별 검색 전략 선택"""
         from workflow.nodes.rag_retriever import _select_search_strategy
         from graph.graph_rag import SearchStrategy
 
-        state = create_initial_state(query="인공지능 연구 동향")
-        state["query_intent"] = "인공지능 연구 동향 파악"
+        state = make_state(query=query)
+        state["query_intent"] = intent
 
         strategy = _select_search_strategy(state)
-        assert strategy == SearchStrategy.VECTOR_ONLY
+        assert strategy == SearchStrategy[expected]
 
-    def test_strategy_selection_graph_enhanced(self):
-        """그래프 확장 검색 전략 선택"""
-        from workflow.nodes.rag_retriever import _select_search_strategy
-        from graph.graph_rag import SearchStrategy
+    def test_empty_query_returns_empty(self, make_state):
+        """빈 쿼리는 빈 결과 반환"""
+        from workflow.nodes.rag_retriever import retrieve_rag
 
-        state = create_initial_state(query="과제번호 검색")
-        state["query_intent"] = "특정 과제 번호로 검색"
+        state = make_state(query="  ")
+        result = retrieve_rag(state)
 
-        strategy = _select_search_strategy(state)
-        assert strategy == SearchStrategy.GRAPH_ENHANCED
+        assert result["rag_results"] == []
+        assert result["search_strategy"] == "none"
 
-    def test_strategy_selection_graph_only(self):
-        """그래프 탐색 전략 선택"""
-        from workflow.nodes.rag_retriever import _select_search_strategy
-        from graph.graph_rag import SearchStrategy
 
-        state = create_initial_state(query="연구 네트워크")
-        state["query_intent"] = "연구자 간 협력 네트워크 분석"
+class TestVectorEnhancerCollections:
+    """Vector Enhancer 엔티티 → 컬렉션 매핑 테스트"""
 
-        strategy = _select_search_strategy(state)
-        assert strategy == SearchStrategy.GRAPH_ONLY
+    def test_empty_entity_types(self):
+        """엔티티 미지정 시 기본 컬렉션 (공유 튜플)"""
+        from workflow.nodes.vector_enhancer import _get_collections_for_entities, DEFAULT_COLLECTIONS
 
-    def test_empty_query_returns_empty(self):
-        """빈 쿼리는 빈 결과 반환"""
-        from workflow.nodes.rag_retriever import retrieve_rag
+        assert _get_collections_for_entities([]) is DEFAULT_COLLECTIONS
+        assert _get_collections_for_entities(["unknown"]) is DEFAULT_COLLECTIONS
 
-        state = create_initial_state(query="  ")
-        result = retrieve_rag(state)
+    def test_deduplicated_union(self):
+        """여러 엔티티가 같은 컬렉션을 가리키면 1회만 포함"""
+        from workflow.nodes.vector_enhancer import _get_collections_for_entities
 
-        assert result["rag_results"] == []
-        assert result["search_strategy"] == "none"
+        result = _get_collections_for_entities(["patent", "applicant", "evalp", "ancm"])
+        assert result == ("patents_v3_collection", "proposals_v3_collection")
 
 
 class TestMergerNode:
@@ -236,14 +265,14 @@ class TestMergerNode:
         unique = _deduplicate_sources(sources)
         assert len(unique) == 3
 
-    def test_hybrid_merge(self):
+    def test_hybrid_merge(self, make_state):
         """하이브리드 병합"""
         from workflow.nodes.merger import merge_results
 
-        state = create_initial_state(query="테스트")
+        state = make_state(query="테스트")
         state["query_type"] = "hybrid"
-        state["sql_result"] = SQLQueryResult(success=True, row_count=5)
-        state["rag_results"] = [SearchResult("id1", "name1", "project", 0.9)]
+        state["sql_result"] = _SQL_OK
+        state["rag_results"] = [_RESULT_PROJECT]
         state["sources"] = []
 
         result = merge_results(state)
@@ -253,16 +282,13 @@ class TestMergerNode:
 class TestGeneratorNode:
     """Generator 노드 테스트"""
 
-    @patch('workflow.nodes.generator.get_llm_client')
-    def test_simple_response(self, mock_llm_getter):
+    def test_simple_response(self, mock_llm, make_state):
         """간단한 응답 생성"""
         from workflow.nodes.generator import generate_response
 
-        mock_llm = Mock()
         mock_llm.generate.return_value = "안녕하세요! 무엇을 도와드릴까요?"
-        mock_llm_getter.return_value = mock_llm
 
-        state = create_initial_state(query="안녕하세요")
+        state = make_state(query="안녕하세요")
         state["query_type"] = "simple"
 
         result = generate_response(state)
@@ -270,18 +296,15 @@ class TestGeneratorNode:
         assert "response" in result
         assert len(result["conversation_history"]) == 2  # user + assistant
 
-    @patch('workflow.nodes.generator.get_llm_client')
-    def test_context_response(self, mock_llm_getter):
+    def test_context_response(self, mock_llm, make_state):
         """컨텍스트 기반 응답 생성"""
         from workflow.nodes.generator import generate_response
 
-        mock_llm = Mock()
         mock_llm.generate.return_value = "검색된 정보를 바탕으로 답변드립니다."
-        mock_llm_getter.return_value = mock_llm
 
-        state = create_initial_state(query="인공지능 특허")
+        state = make_state(query="인공지능 특허")
         state["query_type"] = "rag"
-        state["rag_results"] = [SearchResult("id1", "AI 특허", "patent", 0.9)]
+        state["rag_results"] = [_RESULT_PATENT]
 
         result = generate_response(state)
 
@@ -291,52 +314,109 @@ class TestGeneratorNode:
         assert call_args.kwargs.get("max_tokens", 0) > 500
 
 
+def _fake_sql(state):
+    """execute_sql 대체 - 성공 결과 (호출마다 새 dict 반환)"""
+    return {
+        "sql_result": _SQL_OK,
+        "generated_sql": "SELECT * FROM test",
+        "sources": [{"type": "sql"}]
+    }
+
+
+def _failing_sql(state):
+    """execute_sql 대체 - 실패"""
+    raise Exception("SQL 실패")
+
+
+def _fake_rag(state):
+    """retrieve_rag 대체 - 성공 결과 (호출마다 새 dict 반환)"""
+    return {
+        "rag_results": [_RESULT_PROJECT],
+        "search_strategy": "hybrid",
+        "sources": [{"type": "rag"}]
+    }
+
+
+@pytest.mark.workflow
 class TestParallelExecution:
     """병렬 실행 테스트"""
 
-    @patch('workflow.graph.execute_sql')
-    @patch('workflow.graph.retrieve_rag')
-    def test_parallel_both_success(self, mock_rag, mock_sql):
+    def test_parallel_both_success(self, monkeypatch, make_state):
         """양쪽 모두 성공"""
         from workflow.graph import _parallel_execution
 
-        mock_sql.return_value = {
-            "sql_result": SQLQueryResult(success=True, row_count=5),
-            "generated_sql": "SELECT * FROM test",
-            "sources": [{"type": "sql"}]
-        }
-        mock_rag.return_value = {
-            "rag_results": [SearchResult("id1", "name1", "project", 0.9)],
-            "search_strategy": "hybrid",
-            "sources": [{"type": "rag"}]
-        }
+        monkeypatch.setattr("workflow.graph.execute_sql", _fake_sql)
+        monkeypatch.setattr("workflow.graph.retrieve_rag", _fake_rag)
 
-        state = create_initial_state(query="테스트")
+        state = make_state(query="테스트")
         result = _parallel_execution(state)
 
         assert result["sql_result"] is not None
         assert len(result["rag_results"]) > 0
         assert len(result["sources"]) == 2
 
-    @patch('workflow.graph.execute_sql')
-    @patch('workflow.graph.retrieve_rag')
-    def test_parallel_sql_fails(self, mock_rag, mock_sql):
+    def test_parallel_sql_fails(self, monkeypatch, make_state):
         """SQL 실패 시에도 RAG 결과 반환"""
         from workflow.graph import _parallel_execution
 
-        mock_sql.side_effect = Exception("SQL 실패")
-        mock_rag.return_value = {
-            "rag_results": [SearchResult("id1", "name1", "project", 0.9)],
-            "search_strategy": "hybrid",
-            "sources": [{"type": "rag"}]
-        }
+        monkeypatch.setattr("workflow.graph.execute_sql", _failing_sql)
+        monkeypatch.setattr("workflow.graph.retrieve_rag", _fake_rag)
 
-        state = create_initial_state(query="테스트")
+        state = make_state(query="테스트")
         result = _parallel_execution(state)
 
         assert len(result["rag_results"]) > 0
         assert "error" in result
 
 
+@pytest.mark.workflow
+class TestQueryLengthLimit:
+    """질문 길이 제한 테스트"""
+
+    @patch('workflow.graph.get_workflow')
+    def test_long_query_short_circuits(self, mock_get_workflow):
+        """MAX_QUERY_LEN 초과 시 워크플로우 실행 없이 에러 반환"""
+        from workflow.graph import run_workflow, MAX_QUERY_LEN
+
+        result = run_workflow(query="가" * (MAX_QUERY_LEN + 1))
+
+        mock_get_workflow.assert_not_called()
+        assert result["error"] == "query too long"
+        assert result["response"]
+        assert "elapsed_ms" in result
+
+    @patch('workflow.graph.get_workflow')
+    def test_long_query_short_circuits_astream(self, mock_get_workflow):
+        """astream_workflow도 MAX_QUERY_LEN 초과 시 워크플로우 없이 generator 업데이트 1건만 전송"""
+        import asyncio
+        from workflow.graph import astream_workflow, MAX_QUERY_LEN
+
+        async def collect():
+            return [event async for event in astream_workflow(query="가" * (MAX_QUERY_LEN + 1))]
+
+        events = asyncio.run(collect())
+
+        mock_get_workflow.assert_not_called()
+        assert len(events) == 1
+        assert events[0]["generator"]["error"] == "query too long"
+
+    @patch('api.streaming.get_workflow')
+    def test_long_query_short_circuits_stream_chunks(self, mock_get_workflow):
+        """API 청크 스트리밍도 MAX_QUERY_LEN 초과 시 워크플로우 없이 안내 문구만 반환"""
+        import asyncio
+        from api.streaming import StreamChatRequest, stream_workflow_chunks
+        from workflow.graph import MAX_QUERY_LEN
+
+        request = StreamChatRequest(query="가" * (MAX_QUERY_LEN + 1))
+
+        async def collect():
+            return [chunk async for chunk in stream_workflow_chunks(request)]
+
+        chunks = asyncio.run(collect())
+
+        mock_get_workflow.assert_not_called()
+        assert chunks == [f"질문이 너무 깁니다. {MAX_QUERY_LEN}자 이내로 입력해 주세요."]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
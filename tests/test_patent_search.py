@@ -8,19 +8,80 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import json
+
 import pytest
-from workflow.state import create_initial_state, AgentState
-from workflow.nodes.analyzer import analyze_query
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from workflow.state import AgentState
+
+
+# Stub LLM이 키워드로 추출하는 기술 용어 (테스트 쿼리에 등장하는 것만)
+STUB_TECH_TERMS = ("수소연료전지", "반도체", "인공지능", "자율주행")
+
+
+class StubAnalyzerLLM:
+    """analyze_query가 사용하는 LLM 클라이언트 Stub (네트워크 호출 없음, 결정적 응답)"""
+
+    def _classify(self, prompt: str) -> str:
+        return json.dumps({
+            "query_type": "sql",
+            "query_subtype": "list",
+            "intent": "특허 검색",
+            "entity_types": ["patent"],
+            "related_tables": ["f_patents", "f_patent_applicants"],
+            "keywords": [term for term in STUB_TECH_TERMS if term in prompt],
+        }, ensure_ascii=False)
+
+    def generate(self, prompt: str, *args, **kwargs) -> str:
+        return self._classify(prompt)
+
+    def generate_with_reasoning(self, prompt: str, *args, **kwargs):
+        from llm.llm_client import ReasoningResult
+        answer = self._classify(prompt)
+        return ReasoningResult(answer=answer, raw_response=answer)
+
+
+@pytest.fixture(autouse=True)
+def stub_analyzer_llm(request, monkeypatch):
+    """integration 마커가 없는 테스트는 analyze_query의 LLM을 StubAnalyzerLLM으로 교체 (네트워크 호출 없음)
+
+    실제 LLM 분류는 `pytest -m integration`으로 실행되는 테스트에서만 사용합니다.
+    """
+    if request.node.get_closest_marker("integration"):
+        return
+    monkeypatch.setattr("workflow.nodes.analyzer.get_llm_client", StubAnalyzerLLM)
+
+
+@pytest.fixture(scope="session")
+def analyzer_result(make_state):
+    """쿼리별 analyze_query 결과 캐시 (세션 내 메모리 전용)
+
+    LLM은 stub_analyzer_llm에 의해 StubAnalyzerLLM으로 교체되어 결과가 결정적이므로 같은 쿼리를
+    다시 분석할 필요가 없습니다. 세션 간에는 캐시하지 않아 analyzer 관련 코드 변경이 항상 반영됩니다.
+    반환 state는 테스트 간 공유되므로 읽기 전용으로 사용합니다.
+    """
+    from workflow.nodes.analyzer import analyze_query
+
+    cache = {}
+
+    def analyze(query: str) -> AgentState:
+        if query not in cache:
+            cache[query] = analyze_query(make_state(query, session_id="test-analyzer"))
+        return cache[query]
+
+    return analyze
 
 
 class TestPatentSearch:
     """특허 검색 기능 테스트"""
 
-    def test_entity_types_hardcoded(self):
+    def test_entity_types_hardcoded(self, make_state):
         """entity_types가 항상 ["patent"]로 고정되는지 확인"""
         # Given
-        state = create_initial_state(
-            query="수소연료전지 특허",
+        state = make_state(
+            "수소연료전지 특허",
             session_id="test-001"
         )
 
@@ -28,67 +89,53 @@ class TestPatentSearch:
         assert state["entity_types"] == ["patent"], "entity_types가 ['patent']로 고정되어야 함"
         assert state["query_type"] == "simple", "초기 query_type은 'simple'이어야 함"
 
-    def test_analyzer_forces_patent_entity(self):
+    def test_analyzer_forces_patent_entity(self, analyzer_result):
         """Analyzer가 항상 patent entity를 반환하는지 확인"""
-        # Given
-        state = create_initial_state(
-            query="인공지능 특허 TOP 10 출원기관",
-            session_id="test-002"
-        )
-
         # When
-        result = analyze_query(state)
+        result = analyzer_result("인공지능 특허 TOP 10 출원기관")
 
         # Then
         assert result["entity_types"] == ["patent"], "Analyzer가 ['patent']를 반환해야 함"
         assert "f_patents" in result["related_tables"], "f_patents 테이블이 포함되어야 함"
         assert result["query_subtype"] in ["list", "ranking", "aggregation"], "유효한 subtype이어야 함"
 
-    def test_patent_ranking_query(self):
+    @pytest.mark.parametrize("query", [
+        "수소연료전지 특허 TOP 10 출원기관",
+        "반도체 분야 상위 5개 기업",
+        "인공지능 특허 출원 상위 기관",
+    ])
+    def test_patent_ranking_query(self, analyzer_result, query):
         """특허 랭킹 쿼리 분석 테스트"""
-        # Given
-        queries = [
-            "수소연료전지 특허 TOP 10 출원기관",
-            "반도체 분야 상위 5개 기업",
-            "인공지능 특허 출원 상위 기관",
-        ]
-
-        for query in queries:
-            # When
-            state = create_initial_state(query=query, session_id="test-ranking")
-            result = analyze_query(state)
-
-            # Then
-            assert result["entity_types"] == ["patent"], f"쿼리 '{query}'의 entity_types는 ['patent']여야 함"
-            assert result["query_subtype"] in ["ranking", "list"], "ranking 또는 list subtype이어야 함"
+        # When
+        result = analyzer_result(query)
 
-    def test_patent_trend_query(self):
+        # Then
+        assert result["entity_types"] == ["patent"], f"쿼리 '{query}'의 entity_types는 ['patent']여야 함"
+        assert result["query_subtype"] in ["ranking", "list"], "ranking 또는 list subtype이어야 함"
+
+    @pytest.mark.parametrize("query", [
+        "수소연료전지 특허 동향",
+        "반도체 특허 연도별 추이",
+        "인공지능 특허 증가 추세",
+    ])
+    def test_patent_trend_query(self, analyzer_result, query):
         """특허 동향 분석 쿼리 테스트"""
-        # Given
-        queries = [
-            "수소연료전지 특허 동향",
-            "반도체 특허 연도별 추이",
-            "인공지능 특허 증가 추세",
-        ]
-
-        for query in queries:
-            # When
-            state = create_initial_state(query=query, session_id="test-trend")
-            result = analyze_query(state)
+        # When
+        result = analyzer_result(query)
 
-            # Then
-            assert result["entity_types"] == ["patent"], f"쿼리 '{query}'의 entity_types는 ['patent']여야 함"
-            assert len(result["keywords"]) > 0, "키워드가 추출되어야 함"
+        # Then
+        assert result["entity_types"] == ["patent"], f"쿼리 '{query}'의 entity_types는 ['patent']여야 함"
+        assert len(result["keywords"]) > 0, "키워드가 추출되어야 함"
 
-    def test_literacy_level_support(self):
+    def test_literacy_level_support(self, make_state):
         """리터러시 레벨 지원 확인"""
         # Given
         levels = ["초등", "일반인", "전문가"]
 
         for level in levels:
             # When
-            state = create_initial_state(
-                query="특허란 무엇인가요?",
+            state = make_state(
+                "특허란 무엇인가요?",
                 level=level,
                 session_id=f"test-level-{level}"
             )
@@ -97,16 +144,10 @@ class TestPatentSearch:
             assert state["level"] == level, f"리터러시 레벨 {level}이 유지되어야 함"
             assert state["entity_types"] == ["patent"], "entity_types는 ['patent']여야 함"
 
-    def test_related_tables_always_patent(self):
+    def test_related_tables_always_patent(self, analyzer_result):
         """related_tables가 항상 특허 테이블만 포함하는지 확인"""
-        # Given
-        state = create_initial_state(
-            query="자율주행 특허",
-            session_id="test-tables"
-        )
-
         # When
-        result = analyze_query(state)
+        result = analyzer_result("자율주행 특허")
 
         # Then
         tables = result.get("related_tables", [])
@@ -119,102 +160,165 @@ class TestPatentSearch:
 
 
 class TestServiceConnectivity:
-    """외부 서비스 연결 테스트"""
+    """conftest 서비스 프로브 로직 검증 (HTTP 계층만 Mock - 네트워크 없이 실행)"""
+
+    @pytest.fixture
+    def probe_config(self):
+        """프로브가 읽는 접속 설정 (실제 서비스 주소와 무관한 테스트용 값)"""
+        return SimpleNamespace(
+            QDRANT_URL="http://qdrant.test:6333",
+            QDRANT_COLLECTION="patents_test_collection",
+            VLLM_BASE_URL="http://vllm.test:12288",
+        )
 
-    def test_qdrant_collection_exists(self):
-        """Qdrant patents_v3_collection 존재 확인"""
-        import requests
+    @staticmethod
+    def _http(status_code=200, error=None):
+        http = MagicMock()
+        if error is not None:
+            http.get.side_effect = error
+        else:
+            http.get.return_value.status_code = status_code
+        return http
+
+    @pytest.mark.parametrize("status_code, expected", [(200, True), (404, False)])
+    def test_qdrant_probe(self, probe_config, status_code, expected):
+        """Qdrant 프로브: config의 URL/컬렉션명으로 조회, 200일 때만 정상"""
+        from tests.conftest import _probe_qdrant
+
+        http = self._http(status_code)
 
         # When
-        response = requests.get("http://210.109.80.106:6333/collections/patents_v3_collection")
+        ok, message = _probe_qdrant(http, probe_config)
 
         # Then
-        assert response.status_code == 200, "Qdrant 컬렉션이 존재해야 함"
+        assert ok is expected
+        assert message == "Qdrant 접근 불가"
+        http.get.assert_called_once_with("http://qdrant.test:6333/collections/patents_test_collection", timeout=5)
 
-        data = response.json()
-        assert data["result"]["status"] == "green", "컬렉션 상태가 green이어야 함"
-        assert data["result"]["points_count"] > 1000000, "최소 100만 개 이상의 points가 있어야 함"
+    @pytest.mark.parametrize("status_code, expected", [(200, True), (503, False)])
+    def test_vllm_probe(self, probe_config, status_code, expected):
+        """vLLM 프로브: config의 /health 엔드포인트 조회, 200일 때만 정상"""
+        from tests.conftest import _probe_vllm
 
-    def test_qdrant_vector_dimension(self):
-        """Qdrant 벡터 차원 확인 (1024-dim)"""
-        import requests
+        http = self._http(status_code)
 
         # When
-        response = requests.get("http://210.109.80.106:6333/collections/patents_v3_collection")
-        data = response.json()
+        ok, _ = _probe_vllm(http, probe_config)
 
         # Then
-        vector_size = data["result"]["config"]["params"]["vectors"]["size"]
-        assert vector_size == 1024, "벡터 차원은 1024여야 함"
+        assert ok is expected
+        http.get.assert_called_once_with("http://vllm.test:12288/health", timeout=5)
 
-        distance = data["result"]["config"]["params"]["vectors"]["distance"]
-        assert distance == "Cosine", "거리 메트릭은 Cosine이어야 함"
+    def test_probe_exception_reported_as_failure(self, probe_config, monkeypatch):
+        """HTTP 예외는 해당 서비스 실패로 기록되고 services_check의 skip 판단(첫 번째 실패)으로 이어짐"""
+        from tests.conftest import _first_failure, probe_services
 
-    def test_vllm_health(self):
-        """vLLM 서비스 헬스체크"""
-        import requests
+        monkeypatch.setattr("sql.db_connector.test_connection", lambda: True)
+        http = self._http(error=ConnectionError("connection refused"))
 
         # When
-        response = requests.get("http://210.109.80.106:12288/health", timeout=5)
+        status = probe_services(http, probe_config)
+        available, message = _first_failure(status)
 
         # Then
-        assert response.status_code == 200, "vLLM 서비스가 응답해야 함"
+        assert status["postgresql"] == (True, "PostgreSQL 접근 불가")
+        assert status["qdrant"][0] is False and "connection refused" in status["qdrant"][1]
+        assert not available
+        assert message.startswith("서비스 확인 실패")
 
-    def test_kure_health(self):
-        """KURE 임베딩 API 헬스체크"""
-        import requests
+    def test_all_probes_healthy(self, probe_config, monkeypatch):
+        """모든 프로브 정상 시 services_check는 skip하지 않음"""
+        from tests.conftest import check_services_available
+
+        monkeypatch.setattr("sql.db_connector.test_connection", lambda: True)
 
         # When
-        response = requests.get("http://210.109.80.106:7000/health", timeout=5)
+        available, message = check_services_available(self._http(200), probe_config)
 
         # Then
-        assert response.status_code == 200, "KURE API가 응답해야 함"
+        assert available
+        assert message == "모든 서비스 정상"
 
 
-class TestPatentOnlyEnforcement:
-    """특허만 처리하도록 강제되는지 확인"""
+# 실제 서비스 엔드포인트 (통합 테스트용)
+LIVE_HEALTH_URLS = {
+    "qdrant_collection": "http://210.109.80.106:6333/collections/patents_v3_collection",
+    "vllm": "http://210.109.80.106:12288/health",
+    "kure": "http://210.109.80.106:7000/health",
+}
 
-    def test_no_project_keywords(self):
-        """프로젝트 관련 키워드로 검색해도 patent만 반환"""
-        # Given: 원래는 project 엔티티를 유발하는 쿼리
-        state = create_initial_state(
-            query="국책과제 수소연료전지",
-            session_id="test-project"
-        )
 
-        # When
-        result = analyze_query(state)
+@pytest.fixture(scope="class")
+def live_health_responses():
+    """실제 서비스 엔드포인트를 비동기로 동시 호출 (클래스당 1회, 전체 시간 ≈ 가장 느린 응답)"""
+    import asyncio
+    httpx = pytest.importorskip("httpx")
+
+    async def fetch_all():
+        async with httpx.AsyncClient(timeout=5) as client:
+            responses = await asyncio.gather(*(client.get(url) for url in LIVE_HEALTH_URLS.values()))
+        return dict(zip(LIVE_HEALTH_URLS, responses))
+
+    return asyncio.run(fetch_all())
+
+
+@pytest.fixture(scope="class")
+def qdrant_collection(live_health_responses):
+    """patents_v3_collection 정보 (클래스당 1회 파싱한 JSON dict)"""
+    response = live_health_responses["qdrant_collection"]
+    assert response.status_code == 200, "Qdrant 컬렉션이 존재해야 함"
+    return response.json()
+
+
+@pytest.mark.integration
+class TestServiceConnectivityLive:
+    """외부 서비스 연결 테스트 (실제 서비스 호출 - 통합 테스트)"""
 
+    def test_qdrant_collection_exists(self, qdrant_collection):
+        """Qdrant patents_v3_collection 존재 확인"""
         # Then
-        assert result["entity_types"] == ["patent"], "프로젝트 키워드가 있어도 ['patent']만 반환해야 함"
+        assert qdrant_collection["result"]["status"] == "green", "컬렉션 상태가 green이어야 함"
+        assert qdrant_collection["result"]["points_count"] > 1000000, "최소 100만 개 이상의 points가 있어야 함"
 
-    def test_no_equipment_keywords(self):
-        """장비 관련 키워드로 검색해도 patent만 반환"""
-        # Given
-        state = create_initial_state(
-            query="연구장비 반도체",
-            session_id="test-equipment"
-        )
+    def test_qdrant_vector_dimension(self, qdrant_collection):
+        """Qdrant 벡터 차원 확인 (1024-dim)"""
+        # Then
+        vectors = qdrant_collection["result"]["config"]["params"]["vectors"]
+        assert vectors["size"] == 1024, "벡터 차원은 1024여야 함"
+        assert vectors["distance"] == "Cosine", "거리 메트릭은 Cosine이어야 함"
 
+    def test_vllm_health(self, live_health_responses):
+        """vLLM 서비스 헬스체크"""
         # When
-        result = analyze_query(state)
+        response = live_health_responses["vllm"]
 
         # Then
-        assert result["entity_types"] == ["patent"], "장비 키워드가 있어도 ['patent']만 반환해야 함"
+        assert response.status_code == 200, "vLLM 서비스가 응답해야 함"
 
-    def test_no_announcement_keywords(self):
-        """공고 관련 키워드로 검색해도 patent만 반환"""
-        # Given
-        state = create_initial_state(
-            query="연구개발과제 공고",
-            session_id="test-announcement"
-        )
+    def test_kure_health(self, live_health_responses):
+        """KURE 임베딩 API 헬스체크"""
+        # When
+        response = live_health_responses["kure"]
+
+        # Then
+        assert response.status_code == 200, "KURE API가 응답해야 함"
+
+
+class TestPatentOnlyEnforcement:
+    """특허만 처리하도록 강제되는지 확인"""
 
+    @pytest.mark.parametrize("query, tag", [
+        ("국책과제 수소연료전지", "project"),  # 원래는 project 엔티티를 유발하는 쿼리
+        ("연구장비 반도체", "equipment"),
+        ("연구개발과제 공고", "announcement"),
+    ], ids=["project", "equipment", "announcement"])
+    def test_patent_only_enforced(self, analyzer_result, query, tag):
+        """프로젝트/장비/공고 관련 키워드로 검색해도 patent만 반환"""
         # When
-        result = analyze_query(state)
+        result = analyzer_result(query)
 
         # Then
-        assert result["entity_types"] == ["patent"], "공고 키워드가 있어도 ['patent']만 반환해야 함"
+        assert result["entity_types"] == ["patent"], f"{tag} 키워드가 있어도 ['patent']만 반환해야 함"
 
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@
 1. entity_types=["patent"] 강제 적용
 2. PATENT_COLLECTIONS 사용
 3. domain_mapping.py 미사용
-4. 응답 시간 < 3초
+4. 응답 시간 (단독 실행 < 5초)
 5. 리터러시 레벨 반영
 """
 
@@ -16,44 +16,66 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 
-# 테스트에 필요한 서비스들이 정상인지 사전 확인
-def check_services_available():
-    """테스트 실행 전 필수 서비스 확인"""
-    try:
-        # PostgreSQL
-        from sql.db_connector import test_connection
-        if not test_connection():
-            return False, "PostgreSQL 접근 불가"
+def _timed_run_workflow(run_workflow, **kwargs):
+    """run_workflow 실행 후 (결과, 소요 시간(초)) 반환"""
+    start_time = time.perf_counter()
+    result = run_workflow(**kwargs)
+    return result, time.perf_counter() - start_time
 
-        # Qdrant
-        import requests
-        qdrant_url = os.getenv("QDRANT_URL", "http://210.109.80.106:6333")
-        response = requests.get(f"{qdrant_url}/collections/patents_v3_collection", timeout=5)
-        if response.status_code != 200:
-            return False, "Qdrant 접근 불가"
 
-        # vLLM
-        vllm_url = os.getenv("VLLM_BASE_URL", "http://210.109.80.106:12288")
-        response = requests.get(f"{vllm_url}/health", timeout=5)
-        if response.status_code != 200:
-            return False, "vLLM 접근 불가"
+# services_check fixture (필수 서비스 사전 확인)는 tests/conftest.py에 정의 (세션당 1회 프로브)
+@pytest.fixture(scope="module")
+def run_workflow(services_check):
+    """workflow.graph.run_workflow (서비스 확인 후 모듈당 1회 import - 수집 단계의 LangGraph 로딩 회피)"""
+    from workflow.graph import run_workflow
+    return run_workflow
+
+
+# 단독 실행 응답 시간 상한 (초) - 동시 실행(search_results) 결과가 아닌 순차 실행으로 측정
+RESPONSE_TIME_LIMIT = 5.0
+
+# 검색 유형별 테스트 쿼리 (키: 테스트 함수명)
+SEARCH_QUERIES = {
+    "test_simple_greeting": {"query": "Patent-AX가 뭐야?", "session_id": "test_simple", "level": "일반인"},
+    "test_simple_help": {"query": "어떤 질문을 할 수 있어?", "session_id": "test_help", "level": "일반인"},
+    "test_sql_top_n_ranking": {"query": "수소연료전지 특허 TOP 10 출원기관", "session_id": "test_sql_ranking", "level": "일반인"},
+    "test_sql_patent_count": {"query": "특허 10개 알려줘", "session_id": "test_sql_count", "level": "일반인"},
+    "test_rag_technology_trend": {"query": "인공지능 반도체 기술 동향", "session_id": "test_rag_trend", "level": "일반인"},
+    "test_rag_concept_explanation": {"query": "양자컴퓨터란 무엇인가", "session_id": "test_rag_concept", "level": "일반인"},
+    "test_hybrid_statistics_and_trend": {"query": "반도체 분야 특허 통계와 최신 기술 동향", "session_id": "test_hybrid", "level": "전문가"},
+}
+
+
+@pytest.fixture(scope="module")
+def search_results(run_workflow, request):
+    """선택된 검색 테스트의 쿼리를 한 번에 동시 실행하고 {테스트명: Future[(결과, 소요 시간)]} 반환
+
+    백엔드(vLLM/Qdrant/PostgreSQL)가 요청을 겹쳐 처리하므로 전체 시간이 쿼리별 합이 아닌 가장 느린 쿼리로 수렴합니다.
+    -k 등으로 선택된 테스트의 쿼리만 실행하며, 소요 시간은 동시 부하 상태의 요청별 지연이므로
+    응답 시간 검증에는 사용하지 않습니다 (TestPerformance에서 순차 측정).
+    """
+    selected = {getattr(item, "originalname", item.name) for item in request.session.items} & SEARCH_QUERIES.keys()
+
+    with ThreadPoolExecutor(max_workers=max(len(selected), 1)) as executor:
+        futures = {
+            name: executor.submit(_timed_run_workflow, run_workflow, **SEARCH_QUERIES[name])
+            for name in selected
+        }
 
-        return True, "모든 서비스 정상"
-    except Exception as e:
-        return False, f"서비스 확인 실패: {str(e)}"
+    return futures
 
 
 @pytest.fixture(scope="module")
-def services_check():
-    """모듈 단위로 서비스 확인"""
-    available, message = check_services_available()
-    if not available:
-        pytest.skip(f"필수 서비스 접근 불가: {message}")
-    return available
+def arun_workflow(services_check):
+    """workflow.graph.arun_workflow (서비스 확인 후 모듈당 1회 import)"""
+    from workflow.graph import arun_workflow
+    return arun_workflow
 
 
 class TestPatentSearchSimple:
@@ -61,20 +83,9 @@ class TestPatentSearchSimple:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_simple_greeting(self, services_check):
+    def test_simple_greeting(self, search_results):
         """간단한 인사 쿼리"""
-        from workflow.graph import run_workflow
-
-        query = "Patent-AX가 뭐야?"
-        start_time = time.time()
-
-        result = run_workflow(
-            query=query,
-            session_id="test_simple",
-            level="일반인"
-        )
-
-        elapsed = time.time() - start_time
+        result, elapsed = search_results["test_simple_greeting"].result()
 
         # 검증
         assert result["query_type"] == "simple", f"query_type이 simple이 아님: {result['query_type']}"
@@ -85,22 +96,14 @@ class TestPatentSearchSimple:
         assert result.get("entity_types") == ["patent"], \
             f"entity_types가 ['patent']가 아님: {result.get('entity_types')}"
 
-        print(f"✓ Simple 쿼리 성공: {elapsed:.2f}초")
+        print(f"✓ Simple 쿼리 성공: {elapsed:.2f}초 (동시 부하)")
         print(f"  Response: {result['response'][:100]}...")
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_simple_help(self, services_check):
+    def test_simple_help(self, search_results):
         """도움말 요청 쿼리"""
-        from workflow.graph import run_workflow
-
-        query = "어떤 질문을 할 수 있어?"
-
-        result = run_workflow(
-            query=query,
-            session_id="test_help",
-            level="일반인"
-        )
+        result, _ = search_results["test_simple_help"].result()
 
         # 검증
         assert result["query_type"] == "simple"
@@ -115,20 +118,9 @@ class TestPatentSearchSQL:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_sql_top_n_ranking(self, services_check):
+    def test_sql_top_n_ranking(self, search_results):
         """TOP N 랭킹 쿼리 - PatentRankingLoader"""
-        from workflow.graph import run_workflow
-
-        query = "수소연료전지 특허 TOP 10 출원기관"
-        start_time = time.time()
-
-        result = run_workflow(
-            query=query,
-            session_id="test_sql_ranking",
-            level="일반인"
-        )
-
-        elapsed = time.time() - start_time
+        result, elapsed = search_results["test_sql_top_n_ranking"].result()
 
         # 검증
         assert result["query_type"] in ["sql", "hybrid"], \
@@ -143,26 +135,15 @@ class TestPatentSearchSQL:
         # entity_types 확인
         assert result.get("entity_types") == ["patent"]
 
-        # 응답 시간 확인 (목표: 3초 이내)
-        assert elapsed < 5.0, f"응답 시간 초과: {elapsed:.2f}초 (목표: < 5초)"
-
-        print(f"✓ SQL TOP N 쿼리 성공: {elapsed:.2f}초")
+        print(f"✓ SQL TOP N 쿼리 성공: {elapsed:.2f}초 (동시 부하)")
         print(f"  Loader: {result.get('loader_used', 'N/A')}")
         print(f"  Response: {result['response'][:200]}...")
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_sql_patent_count(self, services_check):
+    def test_sql_patent_count(self, search_results):
         """특허 개수 조회 쿼리"""
-        from workflow.graph import run_workflow
-
-        query = "특허 10개 알려줘"
-
-        result = run_workflow(
-            query=query,
-            session_id="test_sql_count",
-            level="일반인"
-        )
+        result, _ = search_results["test_sql_patent_count"].result()
 
         # 검증
         assert result["query_type"] in ["sql", "hybrid"]
@@ -177,20 +158,9 @@ class TestPatentSearchRAG:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_rag_technology_trend(self, services_check):
+    def test_rag_technology_trend(self, search_results):
         """기술 동향 쿼리 - 벡터 검색"""
-        from workflow.graph import run_workflow
-
-        query = "인공지능 반도체 기술 동향"
-        start_time = time.time()
-
-        result = run_workflow(
-            query=query,
-            session_id="test_rag_trend",
-            level="일반인"
-        )
-
-        elapsed = time.time() - start_time
+        result, elapsed = search_results["test_rag_technology_trend"].result()
 
         # 검증
         assert result["query_type"] in ["rag", "hybrid"], \
@@ -210,31 +180,20 @@ class TestPatentSearchRAG:
         # entity_types 확인
         assert result.get("entity_types") == ["patent"]
 
-        # 응답 시간 확인
-        assert elapsed < 5.0, f"응답 시간 초과: {elapsed:.2f}초"
-
         # Context quality 확인
         context_quality = result.get("context_quality", 0)
         assert context_quality > 0.5, f"Context quality 낮음: {context_quality}"
 
-        print(f"✓ RAG 기술 동향 쿼리 성공: {elapsed:.2f}초")
+        print(f"✓ RAG 기술 동향 쿼리 성공: {elapsed:.2f}초 (동시 부하)")
         print(f"  RAG Results: {len(rag_results)}개")
         print(f"  Context Quality: {context_quality:.2f}")
         print(f"  Response: {result['response'][:200]}...")
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_rag_concept_explanation(self, services_check):
+    def test_rag_concept_explanation(self, search_results):
         """개념 설명 쿼리"""
-        from workflow.graph import run_workflow
-
-        query = "양자컴퓨터란 무엇인가"
-
-        result = run_workflow(
-            query=query,
-            session_id="test_rag_concept",
-            level="일반인"
-        )
+        result, _ = search_results["test_rag_concept_explanation"].result()
 
         # 검증
         assert result["query_type"] in ["rag", "hybrid", "simple"]
@@ -249,20 +208,9 @@ class TestPatentSearchHybrid:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_hybrid_statistics_and_trend(self, services_check):
+    def test_hybrid_statistics_and_trend(self, search_results):
         """통계 + 동향 복합 쿼리"""
-        from workflow.graph import run_workflow
-
-        query = "반도체 분야 특허 통계와 최신 기술 동향"
-        start_time = time.time()
-
-        result = run_workflow(
-            query=query,
-            session_id="test_hybrid",
-            level="전문가"
-        )
-
-        elapsed = time.time() - start_time
+        result, elapsed = search_results["test_hybrid_statistics_and_trend"].result()
 
         # 검증
         assert result["query_type"] == "hybrid", \
@@ -282,10 +230,7 @@ class TestPatentSearchHybrid:
         # entity_types 확인
         assert result.get("entity_types") == ["patent"]
 
-        # 응답 시간 확인
-        assert elapsed < 5.0, f"응답 시간 초과: {elapsed:.2f}초"
-
-        print(f"✓ Hybrid 쿼리 성공: {elapsed:.2f}초")
+        print(f"✓ Hybrid 쿼리 성공: {elapsed:.2f}초 (동시 부하)")
         print(f"  SQL Result: {'있음' if sql_result else '없음'}")
         print(f"  RAG Results: {len(rag_results)}개")
         print(f"  Response: {result['response'][:200]}...")
@@ -296,23 +241,22 @@ class TestLiteracyLevels:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_literacy_levels_different_responses(self, services_check):
+    def test_literacy_levels_different_responses(self, arun_workflow):
         """동일 쿼리에 대해 레벨별로 다른 응답"""
-        from workflow.graph import run_workflow
-
         query = "양자컴퓨터 특허"
         levels = ["초등", "일반인", "전문가"]
-        responses = {}
 
-        for level in levels:
-            result = run_workflow(
-                query=query,
-                session_id=f"test_level_{level}",
-                level=level
-            )
+        # 레벨별 실행은 서로 독립적이므로 하나의 이벤트 루프에서 동시에 실행
+        async def run_all_levels():
+            return await asyncio.gather(*(
+                arun_workflow(query=query, session_id=f"test_level_{level}", level=level)
+                for level in levels
+            ))
 
-            responses[level] = result["response"]
+        results = dict(zip(levels, asyncio.run(run_all_levels())))
+        responses = {level: result["response"] for level, result in results.items()}
 
+        for level, result in results.items():
             # 검증
             assert result.get("entity_types") == ["patent"]
             assert len(result["response"]) > 0
@@ -401,41 +345,49 @@ class TestPerformance:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_response_time_under_threshold(self, services_check):
-        """응답 시간이 목표치 이하인지 확인"""
-        from workflow.graph import run_workflow
-
+    def test_response_time_under_threshold(self, run_workflow):
+        """단독 실행 응답 시간이 목표치 이하인지 확인 (순차 반복 평균)"""
         query = "인공지능 특허 동향"
         iterations = 3
-        times = []
-
-        for i in range(iterations):
-            start_time = time.time()
-
-            result = run_workflow(
-                query=query,
-                session_id=f"test_perf_{i}",
-                level="일반인"
-            )
 
-            elapsed = time.time() - start_time
-            times.append(elapsed)
+        # 단독 실행 응답 시간 기준이므로 순차 실행 (동시 실행 시 부하 상태 지연이 측정됨)
+        times = [
+            _timed_run_workflow(run_workflow, query=query, session_id=f"test_perf_{i}", level="일반인")[1]
+            for i in range(iterations)
+        ]
 
+        for i, elapsed in enumerate(times):
             print(f"  실행 {i+1}: {elapsed:.2f}초")
 
         avg_time = sum(times) / len(times)
 
         # 평균 응답 시간 < 5초 (목표: 2초, 허용: 5초)
-        assert avg_time < 5.0, f"평균 응답 시간 초과: {avg_time:.2f}초"
+        assert avg_time < RESPONSE_TIME_LIMIT, f"평균 응답 시간 초과: {avg_time:.2f}초"
 
         print(f"✓ 성능 테스트 통과: 평균 {avg_time:.2f}초 (목표: < 5초)")
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_context_quality_above_threshold(self, services_check):
-        """Context quality가 임계값 이상인지 확인"""
-        from workflow.graph import run_workflow
+    @pytest.mark.parametrize("name", [
+        "test_sql_top_n_ranking",
+        "test_rag_technology_trend",
+        "test_hybrid_statistics_and_trend",
+    ])
+    def test_search_response_time(self, run_workflow, name):
+        """SQL / RAG / Hybrid 검색 쿼리의 단독 실행 응답 시간 확인 (search_results 동시 실행과 분리)"""
+        params = dict(SEARCH_QUERIES[name], session_id=f"{SEARCH_QUERIES[name]['session_id']}_latency")
+
+        _, elapsed = _timed_run_workflow(run_workflow, **params)
+
+        assert elapsed < RESPONSE_TIME_LIMIT, \
+            f"응답 시간 초과: {elapsed:.2f}초 (목표: < {RESPONSE_TIME_LIMIT:.0f}초)"
 
+        print(f"✓ {name} 응답 시간: {elapsed:.2f}초")
+
+    @pytest.mark.integration
+    @pytest.mark.slow
+    def test_context_quality_above_threshold(self, run_workflow):
+        """Context quality가 임계값 이상인지 확인"""
         query = "반도체 특허 기술"
 
         result = run_workflow(
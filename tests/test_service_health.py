@@ -7,31 +7,50 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import re
 import pytest
-import requests
-from typing import Dict, Any
+from typing import Dict
+
+# .env 형식의 키 정의 (행 시작의 KEY=)
+ENV_KEY_RE = re.compile(r"^([A-Z_][A-Z0-9_]*)\s*=", re.MULTILINE)
+
+# /health 엔드포인트 응답 대기 시간 (정상 서비스는 즉시 응답, 장애 시 빠르게 실패)
+HEALTH_TIMEOUT = 2.0
+
+
+def _health_status(http, url: str) -> int:
+    """/health 상태 코드 조회 - HEAD로 본문 전송 생략, HEAD 미지원(405) 시 본문을 읽지 않는 GET으로 대체"""
+    response = http.head(url, timeout=HEALTH_TIMEOUT)
+    if response.status_code == 405:
+        response = http.get(url, timeout=HEALTH_TIMEOUT, stream=True)
+        response.close()
+    return response.status_code
+
+
+@pytest.fixture(scope="module")
+def service_urls(config) -> Dict[str, str]:
+    """서비스 URL 목록 (세션 config fixture 기준)"""
+    return {
+        "qdrant": config.QDRANT_URL,
+        "vllm": config.VLLM_BASE_URL,
+        "kure": config.KURE_API_URL.replace("/api/embedding", ""),
+        "cugraph": config.CUGRAPH_API_URL,
+    }
+
+
+@pytest.fixture(scope="module")
+def qdrant_collection_response(config, http):
+    """Qdrant 컬렉션 조회 응답 (모듈당 1회)"""
+    return http.get(f"{config.QDRANT_URL}/collections/{config.QDRANT_COLLECTION}", timeout=10)
 
 
 class TestExternalServices:
-    """외부 서비스 (GPU 서버) 헬스체크"""
-
-    @pytest.fixture
-    def service_urls(self) -> Dict[str, str]:
-        """서비스 URL 목록"""
-        return {
-            "qdrant": "http://210.109.80.106:6333",
-            "vllm": "http://210.109.80.106:12288",
-            "kure": "http://210.109.80.106:7000",
-            "cugraph": "http://210.109.80.106:8000"
-        }
-
-    def test_qdrant_patents_collection(self, service_urls):
-        """Qdrant patents_v3_collection 상태 확인"""
+    """외부 서비스 (GPU 서버) 헬스체크 - 세션 공유 http 세션으로 연결 재사용"""
+
+    def test_qdrant_patents_collection(self, qdrant_collection_response):
+        """Qdrant 특허 컬렉션(config.QDRANT_COLLECTION) 상태 확인"""
         # When
-        response = requests.get(
-            f"{service_urls['qdrant']}/collections/patents_v3_collection",
-            timeout=10
-        )
+        response = qdrant_collection_response
 
         # Then
         assert response.status_code == 200, "Qdrant 컬렉션 접근 실패"
@@ -50,74 +69,63 @@ class TestExternalServices:
 
         print(f"✅ Qdrant: {result['points_count']:,} points, status={result['status']}")
 
-    def test_qdrant_scroll_api(self, service_urls):
-        """Qdrant Scroll API 동작 확인"""
-        # When
-        response = requests.post(
-            f"{service_urls['qdrant']}/collections/patents_v3_collection/points/scroll",
-            json={"limit": 1, "with_vector": False},
-            timeout=10
-        )
-
+    def test_qdrant_scroll_api(self, qdrant_sample_point):
+        """Qdrant Scroll API 동작 확인 (세션 fixture가 가져온 point 재사용)"""
         # Then
-        assert response.status_code == 200, "Scroll API 호출 실패"
-
-        data = response.json()
-        assert len(data["result"]["points"]) > 0, "검색 결과 없음"
-
-        point = data["result"]["points"][0]
+        point = qdrant_sample_point
+        assert point is not None, "검색 결과 없음"
         assert "id" in point, "Point에 id 없음"
         assert "payload" in point, "Point에 payload 없음"
 
         print(f"✅ Qdrant Scroll: ID={point['id']}")
 
-    def test_vllm_health(self, service_urls):
+    def test_vllm_health(self, service_urls, http):
         """vLLM 서비스 헬스체크"""
         # When
-        response = requests.get(
-            f"{service_urls['vllm']}/health",
-            timeout=10
-        )
+        status_code = _health_status(http, f"{service_urls['vllm']}/health")
 
         # Then
-        assert response.status_code == 200, "vLLM 서비스 응답 없음"
+        assert status_code == 200, "vLLM 서비스 응답 없음"
         print(f"✅ vLLM: Health OK")
 
-    def test_kure_health(self, service_urls):
+    def test_kure_health(self, service_urls, http):
         """KURE 임베딩 API 헬스체크"""
         # When
-        response = requests.get(
-            f"{service_urls['kure']}/health",
-            timeout=10
-        )
+        status_code = _health_status(http, f"{service_urls['kure']}/health")
 
         # Then
-        assert response.status_code == 200, "KURE API 응답 없음"
+        assert status_code == 200, "KURE API 응답 없음"
         print(f"✅ KURE: Health OK")
 
     @pytest.mark.skip(reason="cuGraph 서비스 재구축 필요")
-    def test_cugraph_health(self, service_urls):
+    def test_cugraph_health(self, service_urls, http):
         """cuGraph 서비스 헬스체크 (현재 비활성)"""
         # When
-        response = requests.get(
-            f"{service_urls['cugraph']}/health",
-            timeout=10
-        )
+        status_code = _health_status(http, f"{service_urls['cugraph']}/health")
 
         # Then
-        assert response.status_code == 200, "cuGraph 서비스 응답 없음"
+        assert status_code == 200, "cuGraph 서비스 응답 없음"
 
 
 class TestDatabaseConnection:
-    """PostgreSQL 데이터베이스 연결 테스트"""
+    """PostgreSQL 데이터베이스 연결 테스트 (세션 공유 pg_conn 사용)"""
 
-    def test_postgres_connection(self):
-        """PostgreSQL 연결 확인"""
-        from sql.db_connector import get_db_connection
+    @pytest.fixture(scope="class")
+    def table_exists(self, pg_conn) -> Dict[str, bool]:
+        """특허 테이블 존재 여부 (to_regclass 카탈로그 조회 1회로 일괄 확인)"""
+        with pg_conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    to_regclass('f_patents') IS NOT NULL,
+                    to_regclass('f_patent_applicants') IS NOT NULL;
+            """)
+            patents, applicants = cursor.fetchone()
+        return {"f_patents": patents, "f_patent_applicants": applicants}
 
+    def test_postgres_connection(self, pg_conn):
+        """PostgreSQL 연결 확인"""
         # When
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
+        with pg_conn.cursor() as cursor:
             cursor.execute("SELECT version();")
             version = cursor.fetchone()
 
@@ -126,52 +134,34 @@ class TestDatabaseConnection:
         assert "PostgreSQL" in version[0], "PostgreSQL이 아님"
         print(f"✅ PostgreSQL: {version[0][:50]}")
 
-    def test_patents_table_exists(self):
+    def test_patents_table_exists(self, table_exists):
         """f_patents 테이블 존재 확인"""
-        from sql.db_connector import get_db_connection
-
-        # When
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COUNT(*) FROM information_schema.tables
-                WHERE table_name = 'f_patents';
-            """)
-            count = cursor.fetchone()[0]
-
         # Then
-        assert count == 1, "f_patents 테이블이 존재하지 않음"
+        assert table_exists["f_patents"], "f_patents 테이블이 존재하지 않음"
         print(f"✅ f_patents 테이블 존재")
 
-    def test_patents_row_count(self):
-        """f_patents 데이터 개수 확인"""
-        from sql.db_connector import get_db_connection
+    def test_patents_row_count(self, pg_conn):
+        """f_patents 데이터 개수 확인 (pg_class 통계 추정치 우선 - COUNT(*) 전체 스캔 회피)
 
+        ANALYZE 전 테이블은 reltuples가 -1(PostgreSQL 14+) 또는 0이므로 통계가 없으면 COUNT(*)로 확인합니다.
+        """
         # When
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM f_patents;")
-            count = cursor.fetchone()[0]
+        with pg_conn.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass('f_patents');")
+            row = cursor.fetchone()
+            count = row[0] if row else 0
+            if count <= 0:
+                cursor.execute("SELECT COUNT(*) FROM f_patents;")
+                count = cursor.fetchone()[0]
 
         # Then
         assert count > 1000000, f"f_patents 데이터 부족: {count:,} rows"
         print(f"✅ f_patents: {count:,} rows")
 
-    def test_patent_applicants_table_exists(self):
+    def test_patent_applicants_table_exists(self, table_exists):
         """f_patent_applicants 테이블 존재 확인"""
-        from sql.db_connector import get_db_connection
-
-        # When
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COUNT(*) FROM information_schema.tables
-                WHERE table_name = 'f_patent_applicants';
-            """)
-            count = cursor.fetchone()[0]
-
         # Then
-        assert count == 1, "f_patent_applicants 테이블이 존재하지 않음"
+        assert table_exists["f_patent_applicants"], "f_patent_applicants 테이블이 존재하지 않음"
         print(f"✅ f_patent_applicants 테이블 존재")
 
 
@@ -190,10 +180,12 @@ class TestConfigFiles:
 
         with open(env_path) as f:
             content = f.read()
-            assert "QDRANT_URL" in content, "QDRANT_URL 설정 없음"
-            assert "VLLM_BASE_URL" in content, "VLLM_BASE_URL 설정 없음"
-            assert "KURE_API_URL" in content, "KURE_API_URL 설정 없음"
-            assert "DB_NAME" in content, "DB_NAME 설정 없음"
+
+        # 정의된 키(KEY=...)를 한 번에 추출해 누락 항목을 일괄 보고
+        required = {"QDRANT_URL", "VLLM_BASE_URL", "KURE_API_URL", "DB_NAME"}
+        defined = set(ENV_KEY_RE.findall(content))
+        missing = required - defined
+        assert not missing, f"설정 없음: {sorted(missing)}"
 
         print(f"✅ .env.example 파일 검증 완료")
 
@@ -0,0 +1,67 @@
+"""
+SQL 프롬프트/템플릿 단위 테스트
+- DB, LLM 없이 실행 가능
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from sql.sql_prompts import (
+    ENTITY_COLUMNS,
+    KEYWORD_PLACEHOLDER,
+    SQL_GENERATION_USER,
+    build_sql_generation_prompt,
+    format_entity_sql,
+    get_entity,
+    select_sql_examples,
+)
+
+
+class TestFormatEntitySQL:
+    """엔티티 표준 SQL 리터럴 치환 테스트"""
+
+    @pytest.mark.parametrize("entity_type", list(ENTITY_COLUMNS))
+    def test_placeholder_replaced(self, entity_type):
+        """모든 엔티티 템플릿의 키워드 자리가 리터럴로 치환됨"""
+        sql = format_entity_sql(entity_type, "수소")
+
+        assert KEYWORD_PLACEHOLDER not in sql
+        assert "'%수소%'" in sql
+
+    def test_quotes_escaped(self):
+        """작은따옴표는 이중화되어 리터럴을 벗어나지 않음"""
+        sql = format_entity_sql("project", "O'Reilly")
+        assert "ILIKE '%O''Reilly%'" in sql
+
+    def test_like_wildcards_escaped(self):
+        """키워드 내 %, _ 는 LIKE 와일드카드로 동작하지 않도록 이스케이프"""
+        sql = format_entity_sql("project", "100%_A")
+        assert "ILIKE '%100\\%\\_A%'" in sql
+
+    def test_unknown_entity(self):
+        """정의되지 않은 엔티티는 ValueError"""
+        assert get_entity("unknown") is None
+        with pytest.raises(ValueError):
+            format_entity_sql("unknown", "키워드")
+
+
+class TestSQLGenerationPrompt:
+    """SQL 생성 프롬프트 구성 테스트"""
+
+    def test_no_hints_matches_template(self):
+        """힌트/예시가 없으면 빈 hints_section과 동일한 프롬프트"""
+        _, user_prompt = build_sql_generation_prompt("특허 10개", "SCHEMA")
+        expected = SQL_GENERATION_USER.format(schema="SCHEMA", hints_section="", question="특허 10개")
+        assert user_prompt == expected
+
+    def test_examples_injected_for_ranking(self):
+        """기관 역량 질문에는 집계 예시 주입 (최대 2개)"""
+        question = "수소연료전지 역량 보유 기관"
+        examples = select_sql_examples(question)
+        _, user_prompt = build_sql_generation_prompt(question, "SCHEMA")
+
+        assert 0 < len(examples) <= 2
+        assert "GROUP BY p.patent_frst_appn" in user_prompt
@@ -89,6 +89,15 @@ class TestUserLevelMapper:
         assert mappings["연구원"] == "L4"
         assert mappings["변리사"] == "L5"
 
+    def test_mappings_read_only(self):
+        """공유 매핑 테이블은 수정 불가, get_all_mappings는 독립 사본 반환"""
+        with pytest.raises(TypeError):
+            UserLevelMapper.LEVEL_MAPPING["연구원"] = "L1"
+
+        mappings = UserLevelMapper.get_all_mappings()
+        mappings["연구원"] = "L1"
+        assert UserLevelMapper().get_initial_level(occupation="연구원") == "L4"
+
 
 class TestUserProfileDatabase:
     """사용자 프로필 DB 연동 테스트 (실제 DB 필요)"""
@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import pytest
 from workflow.state import AgentState, create_initial_state, SearchResult, SQLQueryResult
 from workflow.nodes.analyzer import analyze_query, _check_simple_query
-from workflow.edges import route_query, route_after_sql, route_after_rag
+from workflow.edges import route_query, route_after_sql, route_after_rag, route_after_analyzer, route_after_es_scout
 
 
 class TestState:
@@ -67,14 +67,27 @@ class TestAnalyzer:
         assert result["query_type"] == "simple"
         assert result["query_intent"] == "도움말 요청"
 
+    @pytest.mark.parametrize("query, intent", [
+        ("Hello there", "인사"),
+        ("반갑습니다", "인사"),
+        ("사용법 알려줘", "도움말 요청"),
+        ("가이드 보여줘", "도움말 요청"),
+        ("HELP", "도움말 요청"),
+    ])
+    def test_check_simple_query_keywords(self, query, intent):
+        """인사/도움말 키워드별 감지 (대소문자 무시)"""
+        result = _check_simple_query(query)
+        assert result is not None
+        assert result["query_intent"] == intent
+
     def test_check_simple_query_normal(self):
         """일반 쿼리는 None 반환"""
         result = _check_simple_query("인공지능 특허 알려줘")
         assert result is None
 
-    def test_analyze_empty_query(self):
+    def test_analyze_empty_query(self, make_state):
         """빈 쿼리 분석 테스트"""
-        state = create_initial_state(query="")
+        state = make_state("")
         result = analyze_query(state)
 
         assert result["query_type"] == "simple"
@@ -104,6 +117,51 @@ class TestEdges:
         state = {"query_type": "simple"}
         assert route_query(state) == "generator"
 
+    @pytest.mark.parametrize("entity_types", [["evalp"], ["patent", "ancm"]])
+    def test_route_query_sql_priority_entities(self, entity_types):
+        """SQL 우선 엔티티 포함 시 query_type과 무관하게 SQL 라우팅"""
+        state = {"query_type": "rag", "entity_types": entity_types}
+        assert route_query(state) == "sql_node"
+
+    @pytest.mark.parametrize("router", [route_after_analyzer, route_after_es_scout])
+    @pytest.mark.parametrize("query_subtype, expected", [
+        ("concept", "rag_node"),
+        ("trend_analysis", "sql_node"),
+        ("crosstab_analysis", "sql_node"),
+    ])
+    def test_route_subtype_fast_path(self, router, query_subtype, expected):
+        """subtype 고정 경로 (concept / 통계 분석)는 search_config와 무관하게 결정"""
+        state = {
+            "query_type": "rag",
+            "query_subtype": query_subtype,
+            "keywords": ["반도체"],
+            "entity_types": ["patent"],
+            "search_config": object(),  # 고정 경로에서는 참조되지 않음
+        }
+        assert router(state) == expected
+
+    @pytest.mark.parametrize("query, expected", [
+        ("반도체 공동연구 기관 추천", "sql_node"),
+        ("협업기관을 추천해줘", "sql_node"),
+        ("측정 장비 추천", "rag_node"),
+    ])
+    def test_route_recommendation_collaboration(self, query, expected):
+        """추천 쿼리: 협업 키워드 포함 시 sql_node, 그 외 rag_node 폴백"""
+        state = {"query_type": "rag", "query_subtype": "recommendation", "query": query, "entity_types": []}
+        assert route_query(state) == expected
+
+    def test_route_after_analyzer_search_config_fallback_cached(self):
+        """search_config 없는 state: 동일 조합은 캐시된 설정 재사용 (라우팅 결과 동일)"""
+        from workflow import edges
+
+        edges._cached_search_config.cache_clear()
+        state = {"query_type": "rag", "query_subtype": "list", "entity_types": ["patent"], "keywords": ["반도체"]}
+        first = route_after_analyzer(state)
+        second = route_after_analyzer(dict(state))
+
+        assert first == second
+        assert edges._cached_search_config.cache_info().hits == 1
+
     def test_route_after_sql_hybrid(self):
         """SQL 후 하이브리드 라우팅"""
         state = {"query_type": "hybrid"}
@@ -133,8 +191,8 @@ class TestQueryRouting:
         ("hello", "simple"),
         ("도움말", "simple"),
     ])
-    def test_simple_queries(self, query, expected_type):
+    def test_simple_queries(self, make_state, query, expected_type):
         """간단한 쿼리 라우팅 테스트"""
-        state = create_initial_state(query=query)
+        state = make_state(query)
         result = analyze_query(state)
         assert result["query_type"] == expected_type
@@ -2,16 +2,29 @@
 LangGraph 기반 워크플로우 모듈
 - 통합 에이전트 파이프라인
 - SQL + RAG + LLM 조건부 라우팅
+
+NOTE: 공개 심볼은 첫 접근 시점에 import (PEP 562)
+- workflow.state / workflow.prompts 등 하위 모듈만 사용할 때 LangGraph 로딩 생략
 """
 
-from workflow.state import AgentState, SearchResult, SQLQueryResult, ChatMessage
-from workflow.graph import create_workflow, get_workflow
+import importlib
+
+_LAZY_EXPORTS = {
+    "AgentState": "workflow.state",
+    "SearchResult": "workflow.state",
+    "SQLQueryResult": "workflow.state",
+    "ChatMessage": "workflow.state",
+    "create_workflow": "workflow.graph",
+    "get_workflow": "workflow.graph",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
 
-__all__ = [
-    "AgentState",
-    "SearchResult",
-    "SQLQueryResult",
-    "ChatMessage",
-    "create_workflow",
-    "get_workflow"
-]
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -12,12 +12,70 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import logging
-from typing import Literal
+import re
+from functools import lru_cache
+from typing import Literal, Optional, Tuple
 
-from workflow.state import AgentState, SearchSource
+from workflow.state import AgentState, SearchConfig, SearchSource
+from workflow.search_config import get_search_config
 
 logger = logging.getLogger(__name__)
 
+# Phase 47/48: SQL 라우팅을 강제하는 엔티티 (라우팅 호출마다 set을 새로 만들지 않도록 모듈 상수로 유지)
+SQL_PRIORITY_ENTITIES = frozenset({"evalp", "evalp_detail", "ancm"})
+
+# Phase 91: 추천 쿼리의 협업 기관 판별 보조 키워드
+COLLABORATION_KEYWORDS = frozenset({"협업", "협력", "파트너", "공동연구", "협력기관", "협업기관"})
+# 키워드별 부분 문자열 검사 대신 단일 정규식 1회 스캔 (긴 키워드 우선)
+_COLLABORATION_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(COLLABORATION_KEYWORDS, key=len, reverse=True)))
+)
+
+# query_type → (다음 노드, 로그 메시지) - route_query 최종 분기용 디스패치 테이블
+_QUERY_TYPE_ROUTES = {
+    "sql": ("sql_node", "라우팅: SQL 노드로 이동"),
+    "rag": ("rag_node", "라우팅: RAG 노드로 이동"),
+    "hybrid": ("parallel", "라우팅: 병렬 실행 (SQL + RAG)"),
+}
+_DEFAULT_ROUTE = ("generator", "라우팅: 직접 응답 생성")
+
+# 검색 노드(SQL/RAG) 이후: hybrid만 merger, 나머지는 generator
+_AFTER_RETRIEVAL_ROUTES = {"hybrid": "merger"}
+
+# query_subtype만으로 결정되는 고정 경로 → (다음 노드, 사유)
+# - concept: 개념 설명, DB 검색 불필요
+# - trend_analysis (Phase 99.5) / crosstab_analysis (Phase 99.6): ES aggregations로 직접 통계 집계
+_SUBTYPE_FAST_ROUTES = {
+    "concept": ("rag_node", "concept"),
+    "trend_analysis": ("sql_node", "Phase 99.5: trend_analysis"),
+    "crosstab_analysis": ("sql_node", "Phase 99.6: crosstab_analysis"),
+}
+
+
+def _core_route(query_type: str, query_subtype: str, keywords, entity_types, source: str) -> Optional[str]:
+    """route_after_es_scout / route_after_analyzer 공통 선행 분기
+
+    1. simple + 검색 의도 없음 (인사/잡담) → generator 직행
+    2. subtype 고정 경로 (concept → rag_node, trend_analysis/crosstab_analysis → sql_node)
+
+    Args:
+        source: 로그에 표시할 호출 위치 (es_scout, analyzer)
+
+    Returns:
+        다음 노드 이름, 조기 결정이 없으면 None (호출자별 후속 분기 진행)
+    """
+    if query_type == "simple" and not entity_types and not keywords:
+        logger.info("라우팅: %s → generator (simple, 검색 의도 없음)", source)
+        return "generator"
+
+    fast_route = _SUBTYPE_FAST_ROUTES.get(query_subtype)
+    if fast_route:
+        node, reason = fast_route
+        logger.info("라우팅: %s → %s (%s)", source, node, reason)
+        return node
+
+    return None
+
 
 def route_after_es_scout(state: AgentState) -> Literal["vector_enhancer", "sql_node", "rag_node", "parallel", "sub_queries", "generator"]:
     """Phase 100: ES Scout 후 조건부 라우팅
@@ -41,32 +99,17 @@ def route_after_es_scout(state: AgentState) -> Literal["vector_enhancer", "sql_n
     query_type = state.get("query_type", "simple")
     query_subtype = state.get("query_subtype", "list")
     is_compound = state.get("is_compound", False)
-    sub_queries = state.get("sub_queries", [])
-    keywords = state.get("keywords", [])
-    entity_types = state.get("entity_types", [])
+    sub_queries = state.get("sub_queries", ())
+    keywords = state.get("keywords", ())
+    entity_types = state.get("entity_types", ())
     search_config = state.get("search_config")
 
     print(f"[ROUTE_ES_SCOUT] Phase 100: query_type={query_type}, query_subtype={query_subtype}, entity_types={entity_types}, is_compound={is_compound}, sub_queries_len={len(sub_queries)}")
 
-    # 1. Simple + 검색 의도 없음 (인사/잡담) → generator 직행
-    if query_type == "simple" and not entity_types and not keywords:
-        logger.info("라우팅: es_scout → generator (simple, 검색 의도 없음)")
-        return "generator"
-
-    # 2. Concept → rag_node (개념 설명, DB 검색 불필요)
-    if query_subtype == "concept":
-        logger.info("라우팅: es_scout → rag_node (concept)")
-        return "rag_node"
-
-    # 3. Phase 99.5: trend_analysis → sql_node 직행 (ES aggregations 사용)
-    if query_subtype == "trend_analysis":
-        logger.info("라우팅: es_scout → sql_node (Phase 99.5: trend_analysis)")
-        return "sql_node"
-
-    # 4. Phase 99.6: crosstab_analysis → sql_node 직행
-    if query_subtype == "crosstab_analysis":
-        logger.info("라우팅: es_scout → sql_node (Phase 99.6: crosstab_analysis)")
-        return "sql_node"
+    # 1~4. simple 직행 / subtype 고정 경로 (공통 분기)
+    node = _core_route(query_type, query_subtype, keywords, entity_types, "es_scout")
+    if node:
+        return node
 
     # 5. Phase 104.2: 복합 질의도 vector_enhancer 거쳐야 함 (키워드 확장 필요)
     # compound 분기를 route_query()로 이동 (vector_enhancer 이후 호출됨)
@@ -88,6 +131,25 @@ def route_after_es_scout(state: AgentState) -> Literal["vector_enhancer", "sql_n
     return "vector_enhancer"
 
 
+@lru_cache(maxsize=512)
+def _cached_search_config(
+    query_type: str,
+    query_subtype: str,
+    entity_types: Tuple[str, ...],
+    ranking_type: str
+) -> SearchConfig:
+    """get_search_config 결과 캐시 (결정에 쓰이는 필드 조합 기준)
+
+    반환된 SearchConfig는 여러 호출이 공유하므로 라우팅에서 읽기 전용으로만 사용합니다.
+    """
+    return get_search_config({
+        "query_type": query_type,
+        "query_subtype": query_subtype,
+        "entity_types": list(entity_types),
+        "ranking_type": ranking_type,
+    })
+
+
 def route_after_analyzer(state: AgentState) -> Literal["vector_enhancer", "sql_node", "rag_node", "parallel", "sub_queries", "generator"]:
     """Phase 36/89: Analyzer 이후 조건부 라우팅
 
@@ -100,43 +162,29 @@ def route_after_analyzer(state: AgentState) -> Literal["vector_enhancer", "sql_n
     Returns:
         다음 노드 이름
     """
+    # 라우팅에 사용하는 필드만 조회 (빈 기본값은 호출마다 리스트를 만들지 않도록 공유 튜플)
     query_type = state.get("query_type", "simple")
     query_subtype = state.get("query_subtype", "list")
-    is_compound = state.get("is_compound", False)
-    sub_queries = state.get("sub_queries", [])
-    is_aggregation = state.get("is_aggregation", False)
-    keywords = state.get("keywords", [])
-    entity_types = state.get("entity_types", [])
+    keywords = state.get("keywords", ())
+    entity_types = state.get("entity_types", ())
+
+    # 1~2. simple 직행 / subtype 고정 경로 (공통 분기, 벡터 확장 불필요)
+    # - concept: "~란 무엇인가?" 형태는 엔티티와 무관하게 개념 설명 → rag_node
+    # - trend_analysis / crosstab_analysis: ES (nested) aggregations 통계 → sql_node
+    node = _core_route(query_type, query_subtype, keywords, entity_types, "analyzer")
+    if node:
+        return node
 
     # Phase 89: SearchConfig 가져오기 (analyzer에서 생성됨)
     search_config = state.get("search_config")
     if not search_config:
-        # fallback: analyzer에서 생성되지 않은 경우
-        from workflow.search_config import get_search_config
-        search_config = get_search_config(state)
-
-    # 1. Simple + 검색 의도 없음 (인사/잡담) → generator 직행
-    if query_type == "simple" and not entity_types and not keywords:
-        logger.info("라우팅: simple (검색 의도 없음) → generator")
-        return "generator"
-
-    # 2. Concept → rag_node (개념 설명, DB 검색 불필요)
-    # "~란 무엇인가?" 형태는 엔티티와 무관하게 개념 설명
-    if query_subtype == "concept":
-        logger.info("라우팅: concept → rag_node (벡터 스킵)")
-        return "rag_node"
-
-    # Phase 99.5: trend_analysis → sql_node 직행 (ES aggregations 사용)
-    # 벡터 확장 불필요, ES aggregations로 직접 통계 집계
-    if query_subtype == "trend_analysis":
-        logger.info("라우팅: trend_analysis → sql_node (Phase 99.5: ES aggregations)")
-        return "sql_node"
-
-    # Phase 99.6: crosstab_analysis → sql_node 직행 (ES nested aggregations 사용)
-    # 출원기관별 연도별 크로스탭 통계
-    if query_subtype == "crosstab_analysis":
-        logger.info("라우팅: crosstab_analysis → sql_node (Phase 99.6: ES nested aggregations)")
-        return "sql_node"
+        # fallback: analyzer에서 생성되지 않은 경우 (get_search_config와 동일한 기본값으로 캐시 조회)
+        search_config = _cached_search_config(
+            state.get("query_type", "rag"),
+            state.get("query_subtype", "list"),
+            tuple(state.get("entity_types", ())),
+            state.get("ranking_type", "simple"),
+        )
 
     # Phase 89: Loader 사용 가능 시 SQL 우선 라우팅
     if search_config.use_loader and search_config.loader_name:
@@ -161,8 +209,7 @@ def route_after_analyzer(state: AgentState) -> Literal["vector_enhancer", "sql_n
         return "rag_node"
 
     # Phase 47/48: evalp/evalp_detail/ancm 엔티티는 SQL 라우팅 강제 (concept 제외)
-    sql_priority_entities = {"evalp", "evalp_detail", "ancm"}
-    if any(et in sql_priority_entities for et in entity_types):
+    if not SQL_PRIORITY_ENTITIES.isdisjoint(entity_types):
         logger.info(f"라우팅: SQL 우선 엔티티 {entity_types} → vector_enhancer (SQL 경로)")
         return "vector_enhancer"
 
@@ -229,11 +276,10 @@ def route_query(state: AgentState) -> Literal["sql_node", "rag_node", "parallel"
 
         # 3. 협업 기관 추천 (proposal/patent 또는 협업 키워드)
         # Phase 91: 협업 키워드는 보조 조건으로만 사용 (entity_types 우선)
-        COLLABORATION_KEYWORDS = {"협업", "협력", "파트너", "공동연구", "협력기관", "협업기관"}
         is_collaboration = (
             "proposal" in entity_types or
             "patent" in entity_types or
-            any(kw in query for kw in COLLABORATION_KEYWORDS)
+            _COLLABORATION_PATTERN.search(query) is not None
         )
         if is_collaboration:
             logger.info("라우팅: recommendation (협업 기관) → sql_node (Phase 91)")
@@ -252,23 +298,13 @@ def route_query(state: AgentState) -> Literal["sql_node", "rag_node", "parallel"
             return "rag_node"
 
     # Phase 47/48: evalp/evalp_detail/ancm 엔티티는 SQL 라우팅 강제
-    sql_priority_entities = {"evalp", "evalp_detail", "ancm"}
-    if any(et in sql_priority_entities for et in entity_types):
+    if not SQL_PRIORITY_ENTITIES.isdisjoint(entity_types):
         logger.info(f"라우팅: SQL 우선 엔티티 {entity_types} → sql_node")
         return "sql_node"
 
-    if query_type == "sql":
-        logger.info("라우팅: SQL 노드로 이동")
-        return "sql_node"
-    elif query_type == "rag":
-        logger.info("라우팅: RAG 노드로 이동")
-        return "rag_node"
-    elif query_type == "hybrid":
-        logger.info("라우팅: 병렬 실행 (SQL + RAG)")
-        return "parallel"
-    else:
-        logger.info("라우팅: 직접 응답 생성")
-        return "generator"
+    node, message = _QUERY_TYPE_ROUTES.get(query_type, _DEFAULT_ROUTE)
+    logger.info(message)
+    return node
 
 
 def route_after_sql(state: AgentState) -> Literal["merger", "generator"]:
@@ -308,14 +344,8 @@ def route_after_rag(state: AgentState) -> Literal["merger", "generator"]:
     Returns:
         다음 노드 이름
     """
-    query_type = state.get("query_type", "rag")
-
-    # hybrid인 경우 merger로
-    if query_type == "hybrid":
-        return "merger"
-
-    # rag 전용인 경우 바로 generator로
-    return "generator"
+    # hybrid인 경우 merger로, rag 전용인 경우 바로 generator로
+    return _AFTER_RETRIEVAL_ROUTES.get(state.get("query_type", "rag"), "generator")
 
 
 def should_continue(state: AgentState) -> Literal["continue", "end"]:
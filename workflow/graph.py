@@ -29,6 +29,9 @@ from workflow.edges import route_query, route_after_sql, route_after_rag, route_
 
 logger = logging.getLogger(__name__)
 
+# 입력 질문 최대 길이 - 초과 시 파이프라인(LLM/임베딩/검색) 실행 없이 즉시 에러 반환
+MAX_QUERY_LEN = int(os.getenv("MAX_QUERY_LEN", "2048"))
+
 
 def _timed_node(name: str, func):
     """노드 함수를 래핑하여 처리 시간을 측정하고 로깅"""
@@ -541,6 +544,20 @@ def get_workflow():
     return _workflow
 
 
+def _reject_long_query(query: str, session_id: str, start_time: float) -> Dict[str, Any]:
+    """MAX_QUERY_LEN 초과 질문에 대한 즉시 응답 (상태 생성/노드 실행 없음)"""
+    logger.warning(f"질문 길이 초과: {len(query)}자 (최대 {MAX_QUERY_LEN}자) - 워크플로우 생략")
+    return {
+        "query": query,
+        "session_id": session_id,
+        "query_type": "simple",
+        "response": f"질문이 너무 깁니다. {MAX_QUERY_LEN}자 이내로 입력해 주세요.",
+        "sources": [],
+        "error": "query too long",
+        "elapsed_ms": round((time.time() - start_time) * 1000, 2),
+    }
+
+
 def run_workflow(
     query: str,
     session_id: str = "default",
@@ -560,6 +577,9 @@ def run_workflow(
     """
     start_time = time.time()
 
+    if len(query) > MAX_QUERY_LEN:
+        return _reject_long_query(query, session_id, start_time)
+
     # 초기 상태 생성
     initial_state = create_initial_state(
         query=query,
@@ -661,6 +681,11 @@ async def astream_workflow(
             for node_name, output in event.items():
                 print(f"{node_name}: {output}")
     """
+    # 길이 초과 질문은 워크플로우 없이 generator 업데이트 1건으로 응답
+    if len(query) > MAX_QUERY_LEN:
+        yield {"generator": _reject_long_query(query, session_id, time.time())}
+        return
+
     # 초기 상태 생성
     initial_state = create_initial_state(query=query, session_id=session_id)
 
@@ -674,13 +699,15 @@ async def astream_workflow(
 
 async def arun_workflow(
     query: str,
-    session_id: str = "default"
+    session_id: str = "default",
+    level: str = "일반인"
 ) -> Dict[str, Any]:
     """워크플로우 비동기 실행 (스트리밍 없음)
 
     Args:
         query: 사용자 질문
         session_id: 세션 ID
+        level: 사용자 리터러시 수준 (초등/일반인/전문가)
 
     Returns:
         최종 상태 딕셔너리
@@ -688,8 +715,11 @@ async def arun_workflow(
     import time
     start_time = time.time()
 
+    if len(query) > MAX_QUERY_LEN:
+        return _reject_long_query(query, session_id, start_time)
+
     # 초기 상태 생성
-    initial_state = create_initial_state(query=query, session_id=session_id)
+    initial_state = create_initial_state(query=query, session_id=session_id, level=level)
 
     # 워크플로우 실행
     workflow = get_workflow()
@@ -41,6 +41,7 @@ COMPLEX_RANKING_PATTERNS = [
     r"(KR|US|JP|CN|한국|미국|일본|중국).*(?:와|과|,|및).*(?:KR|US|JP|CN|한국|미국|일본|중국)",  # 다중 국가
     r"(?:등록|출원).*(?:기관|기업|회사).*(?:비교|대비)",  # 등록/출원 비교
 ]
+_COMPLEX_RANKING_REGEXES = tuple(re.compile(p, re.IGNORECASE) for p in COMPLEX_RANKING_PATTERNS)
 
 # Reasoning Mode 사용 여부 설정
 # Phase 105: EXAONE 4.0.1 추론 기능 활성화 (기본값 true로 변경)
@@ -328,8 +329,8 @@ def _is_complex_ranking(query: str, structured_keywords: Dict = None) -> Tuple[b
             return True, f"집계 키워드 '{kw}' 감지 → SQL 필수"
 
     # 3. 복잡한 패턴 검사 (연도 범위, 다중 국가 등)
-    for pattern in COMPLEX_RANKING_PATTERNS:
-        if re.search(pattern, query, re.IGNORECASE):
+    for pattern in _COMPLEX_RANKING_REGEXES:
+        if pattern.search(query):
             return True, f"복잡 패턴 감지 → SQL 필수"
 
     # 4. structured_keywords에서 다중 국가 검사
@@ -440,13 +441,25 @@ def analyze_query(state: AgentState) -> AgentState:
         }
 
 
+def _compile_alternation(keywords) -> "re.Pattern":
+    """키워드 집합 → 단일 alternation 정규식 (긴 키워드 우선)"""
+    return re.compile("|".join(map(re.escape, sorted(keywords, key=len, reverse=True))))
+
+
+# 간단 쿼리(인사/도움말) 판별 키워드 - 매 쿼리마다 리스트를 순회하지 않도록 단일 정규식으로 1회 컴파일
+GREETING_KEYWORDS = frozenset(["안녕", "hello", "hi", "반갑", "안녕하세요"])
+HELP_KEYWORDS = frozenset(["도움", "help", "사용법", "가이드"])
+
+_GREETING_PATTERN = _compile_alternation(GREETING_KEYWORDS)
+_HELP_PATTERN = _compile_alternation(HELP_KEYWORDS)
+
+
 def _check_simple_query(query: str) -> Dict[str, Any] | None:
     """간단한 규칙 기반 사전 분류"""
     query_lower = query.lower().strip()
 
     # 인사말
-    greetings = ["안녕", "hello", "hi", "반갑", "안녕하세요"]
-    if any(g in query_lower for g in greetings):
+    if _GREETING_PATTERN.search(query_lower):
         return {
             "query_type": "simple",
             "query_intent": "인사",
@@ -456,8 +469,7 @@ def _check_simple_query(query: str) -> Dict[str, Any] | None:
         }
 
     # 도움말
-    help_words = ["도움", "help", "사용법", "가이드"]
-    if any(h in query_lower for h in help_words):
+    if _HELP_PATTERN.search(query_lower):
         return {
             "query_type": "simple",
             "query_intent": "도움말 요청",
@@ -469,6 +481,23 @@ def _check_simple_query(query: str) -> Dict[str, Any] | None:
     return None
 
 
+# Phase 98: 장비 쿼리 판별 키워드 (모듈 로드 시 1회 컴파일)
+# 키워드 리스트 순회(any(kw in query)) 대신 타입별 단일 정규식 스캔
+EQUIP_KEYWORDS = frozenset(["장비", "측정기", "시험기", "분석기", "시스템", "기기", "스캐너", "현미경"])
+EQUIP_ACTION_KEYWORDS = frozenset(["보유", "찾", "추천", "검색", "알려", "있는", "가진", "갖고"])
+EQUIP_REGION_KEYWORDS = (
+    "경기", "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종",
+    "경북", "경남", "전북", "전남", "충북", "충남", "강원", "제주", "지역",
+)
+
+
+_EQUIP_PATTERN = _compile_alternation(EQUIP_KEYWORDS)
+_EQUIP_ACTION_PATTERN = _compile_alternation(EQUIP_ACTION_KEYWORDS)
+_EQUIP_REGION_PATTERN = _compile_alternation(EQUIP_REGION_KEYWORDS)
+_EQUIP_NAME_PATTERN = re.compile(r'([가-힣a-zA-Z]+(?:측정기|시험기|분석기|스캐너|현미경|시스템|기기|장비))')
+_EQUIP_SUFFIX_PATTERN = re.compile(r'(측정기|시험기|분석기|스캐너|현미경|시스템|기기|장비)$')
+
+
 def _check_equipment_query(query: str) -> Dict[str, Any] | None:
     """Phase 98: 장비 관련 쿼리 규칙 기반 분류
 
@@ -483,17 +512,10 @@ def _check_equipment_query(query: str) -> Dict[str, Any] | None:
     """
     query_lower = query.lower()
 
-    # 장비 관련 키워드
-    equip_keywords = ["장비", "측정기", "시험기", "분석기", "시스템", "기기", "스캐너", "현미경"]
-    # 검색/조회 액션 키워드
-    action_keywords = ["보유", "찾", "추천", "검색", "알려", "있는", "가진", "갖고"]
-    # 지역 키워드 (지역 필터 장비 검색)
-    region_keywords = ["경기", "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종",
-                       "경북", "경남", "전북", "전남", "충북", "충남", "강원", "제주", "지역"]
-
-    has_equip = any(kw in query_lower for kw in equip_keywords)
-    has_action = any(kw in query_lower for kw in action_keywords)
-    has_region = any(kw in query_lower for kw in region_keywords)
+    # 장비 / 검색·조회 액션 / 지역 키워드 존재 여부 (정규식 1회 스캔씩)
+    has_equip = _EQUIP_PATTERN.search(query_lower) is not None
+    has_action = _EQUIP_ACTION_PATTERN.search(query_lower) is not None
+    has_region = _EQUIP_REGION_PATTERN.search(query_lower) is not None
 
     # 장비 키워드 + 액션 키워드 조합 감지
     if has_equip and (has_action or has_region):
@@ -502,18 +524,16 @@ def _check_equipment_query(query: str) -> Dict[str, Any] | None:
 
         # Phase 98: 장비 이름에서 핵심 용어만 추출
         # "광탄성시험기" → "광탄성", "표면단차측정기" → "표면단차" 또는 "단차"
-        import re
 
         # 1. 먼저 전체 장비명 패턴 매칭
-        equip_pattern = r'([가-힣a-zA-Z]+(?:측정기|시험기|분석기|스캐너|현미경|시스템|기기|장비))'
-        equip_matches = re.findall(equip_pattern, query)
+        equip_matches = _EQUIP_NAME_PATTERN.findall(query)
 
         # 2. 매칭된 장비명에서 접미사(측정기, 시험기 등) 제거하여 핵심 키워드 추출
         for match in equip_matches:
             # 전체 장비명도 추가
             extracted_keywords.append(match)
             # 접미사 제거한 핵심 키워드도 추가 (검색 정확도 향상)
-            core_keyword = re.sub(r'(측정기|시험기|분석기|스캐너|현미경|시스템|기기|장비)$', '', match)
+            core_keyword = _EQUIP_SUFFIX_PATTERN.sub('', match)
             if core_keyword and len(core_keyword) >= 2 and core_keyword != match:
                 extracted_keywords.append(core_keyword)
                 logger.info(f"Phase 98: 장비 핵심 키워드 추출 - {match} → {core_keyword}")
@@ -550,7 +570,7 @@ def _check_equipment_query(query: str) -> Dict[str, Any] | None:
 
         # 지역 추출
         extracted_regions = []
-        for region in region_keywords:
+        for region in EQUIP_REGION_KEYWORDS:
             if region in query_lower and region != "지역":
                 extracted_regions.append(region)
 
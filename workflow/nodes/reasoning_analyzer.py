@@ -21,6 +21,27 @@ from llm.llm_client import get_llm_client, ReasoningResult
 
 logger = logging.getLogger(__name__)
 
+# 응답 파싱 / 규칙 분류용 정규식 (모듈 로드 시 1회 컴파일)
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*\}', re.DOTALL)
+_COMPOUND_JSON_RE = re.compile(r'\{[^{}]*"is_compound"[^{}]*\}', re.DOTALL)
+_SUB_QUERIES_JSON_RE = re.compile(r'\{.*"sub_queries".*\}', re.DOTALL)
+_INTENT_RE = re.compile(r'의도[:\s]+([^\n]+)')
+_TABLE_NAME_RE = re.compile(r'f_\w+')
+_KEYWORDS_RE = re.compile(r'키워드[:\s]+\[([^\]]+)\]')
+
+# 명확한 SQL 패턴 (숫자 + 목록/개수) - quick_classify에서 하나라도 매칭되면 LLM 분석으로 넘김
+_SQL_HINT_RE = re.compile("|".join([
+    r'\d+\s*개',           # "10개", "5개"
+    r'상위\s*\d+',         # "상위 10"
+    r'가장\s*(큰|많은|높은|낮은|적은)',  # "가장 큰"
+    r'몇\s*개',            # "몇 개"
+    r'목록',               # "목록"
+    r'리스트',             # "리스트"
+    r'통계',               # "통계"
+    r'순위',               # "순위"
+]))
+
 
 @dataclass
 class SubQuery:
@@ -174,12 +195,12 @@ def _parse_reasoning_result(result: ReasoningResult) -> AnalysisResult:
     answer = result.answer
 
     # JSON 블록 찾기
-    json_match = re.search(r'```json\s*(.*?)\s*```', answer, re.DOTALL)
+    json_match = _JSON_BLOCK_RE.search(answer)
     if json_match:
         json_str = json_match.group(1)
     else:
         # JSON 블록 없으면 전체 텍스트에서 JSON 추출 시도
-        json_match = re.search(r'\{[^{}]*\}', answer, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(answer)
         if json_match:
             json_str = json_match.group(0)
         else:
@@ -252,7 +273,7 @@ def _parse_text_result(text: str, analysis: AnalysisResult) -> AnalysisResult:
         analysis.query_type = "rag"
 
     # 의도 추출 (첫 번째 줄 또는 "의도:" 이후)
-    intent_match = re.search(r'의도[:\s]+([^\n]+)', text)
+    intent_match = _INTENT_RE.search(text)
     if intent_match:
         analysis.intent = intent_match.group(1).strip()
     else:
@@ -260,12 +281,12 @@ def _parse_text_result(text: str, analysis: AnalysisResult) -> AnalysisResult:
         analysis.intent = lines[0] if lines else ""
 
     # 테이블 추출
-    table_match = re.findall(r'f_\w+', text)
+    table_match = _TABLE_NAME_RE.findall(text)
     if table_match:
         analysis.sql_elements.tables = list(set(table_match))
 
     # 키워드 추출
-    keyword_match = re.search(r'키워드[:\s]+\[([^\]]+)\]', text)
+    keyword_match = _KEYWORDS_RE.search(text)
     if keyword_match:
         keywords = [k.strip().strip('"\'') for k in keyword_match.group(1).split(',')]
         analysis.rag_elements.keywords = keywords
@@ -322,18 +343,7 @@ def quick_classify(query: str) -> Optional[Dict[str, Any]]:
         }
 
     # 명확한 SQL 패턴 (숫자 + 목록/개수)
-    sql_patterns = [
-        r'\d+\s*개',           # "10개", "5개"
-        r'상위\s*\d+',         # "상위 10"
-        r'가장\s*(큰|많은|높은|낮은|적은)',  # "가장 큰"
-        r'몇\s*개',            # "몇 개"
-        r'목록',               # "목록"
-        r'리스트',             # "리스트"
-        r'통계',               # "통계"
-        r'순위',               # "순위"
-    ]
-
-    if any(re.search(p, query_lower) for p in sql_patterns):
+    if _SQL_HINT_RE.search(query_lower):
         # SQL 가능성 높음, 하지만 LLM으로 세부 분석 필요
         return None  # LLM 분석으로 넘김
 
@@ -450,15 +460,15 @@ def _parse_decomposition_result(result: ReasoningResult) -> DecompositionResult:
     answer = result.answer
 
     # JSON 블록 찾기
-    json_match = re.search(r'```json\s*(.*?)\s*```', answer, re.DOTALL)
+    json_match = _JSON_BLOCK_RE.search(answer)
     if json_match:
         json_str = json_match.group(1)
     else:
         # JSON 블록 없으면 전체 텍스트에서 JSON 추출 시도
-        json_match = re.search(r'\{[^{}]*"is_compound"[^{}]*\}', answer, re.DOTALL)
+        json_match = _COMPOUND_JSON_RE.search(answer)
         if not json_match:
             # 더 넓은 패턴으로 시도
-            json_match = re.search(r'\{.*"sub_queries".*\}', answer, re.DOTALL)
+            json_match = _SUB_QUERIES_JSON_RE.search(answer)
         if json_match:
             json_str = json_match.group(0)
         else:
@@ -427,9 +427,9 @@ def _execute_single_entity_sql(
     Returns:
         {"sql_result": SQLQueryResult, "generated_sql": str, "entity_type": str}
     """
-    from sql.sql_prompts import ENTITY_COLUMNS, ENTITY_LABELS
+    from sql.sql_prompts import get_entity, format_entity_sql, ENTITY_LABELS
 
-    entity_config = ENTITY_COLUMNS.get(entity_type)
+    entity_config = get_entity(entity_type)
     if not entity_config:
         return {
             "sql_result": SQLQueryResult(success=False, error=f"Unknown entity type: {entity_type}"),
@@ -513,7 +513,7 @@ WHERE {id_column} IN ({es_ids_str})
                     "equipment": "f_equipments",
                     "proposal": "f_proposal_profile",
                 }
-                table_name = entity_table_map.get(entity_type, entity_config['table'])
+                table_name = entity_table_map.get(entity_type, entity_config.table)
 
                 # 엔티티별 SELECT 컬럼
                 entity_select_map = {
@@ -941,7 +941,7 @@ LIMIT 10"""
                         "search_source": "elasticsearch"
                     }
                 # 최종 폴백: LLM 에이전트 사용
-                sql_template = entity_config['sql_template'].format(keyword=hint_keyword)
+                sql_template = format_entity_sql(entity_type, hint_keyword)
 
         # Phase 104.3: project ranking 쿼리 - 기관별 과제 수행 집계
         elif query_subtype == "ranking" and entity_type == "project":
@@ -1019,15 +1019,15 @@ LIMIT 20"""
             except Exception as e:
                 logger.error(f"[{entity_type}] Phase 104.3 직접 실행 실패: {e}")
                 # 폴백: LLM 에이전트 사용
-                sql_template = entity_config['sql_template'].format(keyword=hint_keyword)
+                sql_template = format_entity_sql(entity_type, hint_keyword)
 
         else:
-            sql_template = entity_config['sql_template'].format(keyword=hint_keyword)
+            sql_template = format_entity_sql(entity_type, hint_keyword)
 
         # 엔티티별 테이블 힌트 추가
         table_hint = f"""## 검색 대상 엔티티: {entity_label}
-사용할 테이블: {entity_config['table']}
-반환할 컬럼: {', '.join(entity_config['aliases'])}
+사용할 테이블: {entity_config.table}
+반환할 컬럼: {', '.join(entity_config.aliases)}
 
 표준 SQL 패턴:
 {sql_template}
@@ -1298,8 +1298,9 @@ def _detect_classification_type_from_query(query: str) -> str:
     from sql.sql_prompts import CLASSIFICATION_TYPE_MAPPING
 
     # 질문에서 분류체계 키워드 탐지
+    query_lower = query.lower()
     for keyword, saf_code in CLASSIFICATION_TYPE_MAPPING.items():
-        if keyword.lower() in query.lower():
+        if keyword.lower() in query_lower:
             logger.info(f"Phase 62: 분류체계 감지 - '{keyword}' → {saf_code}")
             return saf_code
 
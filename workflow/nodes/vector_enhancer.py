@@ -13,7 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 import logging
 import re
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Tuple
 from collections import Counter
 
 from workflow.state import AgentState
@@ -42,6 +42,29 @@ ENTITY_TO_COLLECTION = {
     "ancm": ["proposals_v3_collection"],   # 공고 - 제안서 컬렉션에서 검색
 }
 
+# 엔티티 미지정/매핑 없음 시 기본 컬렉션 (특허+과제)
+DEFAULT_COLLECTIONS: Tuple[str, ...] = ("patents_v3_collection", "projects_v3_collection")
+
+# 엔티티 타입 → 비트 플래그, 비트마스크 → 컬렉션 튜플 (모듈 로드 시 전체 부분집합 사전 계산)
+# 컬렉션 순서는 ENTITY_TO_COLLECTION 정의 순서를 따름
+_ENTITY_BIT = {entity_type: 1 << i for i, entity_type in enumerate(ENTITY_TO_COLLECTION)}
+
+
+def _build_mask_to_collections() -> Dict[int, Tuple[str, ...]]:
+    table = {0: DEFAULT_COLLECTIONS}
+    for mask in range(1, 1 << len(_ENTITY_BIT)):
+        collections = []
+        for entity_type, bit in _ENTITY_BIT.items():
+            if mask & bit:
+                for collection in ENTITY_TO_COLLECTION[entity_type]:
+                    if collection not in collections:
+                        collections.append(collection)
+        table[mask] = tuple(collections)
+    return table
+
+
+_MASK_TO_COLLECTIONS = _build_mask_to_collections()
+
 # 엔티티 타입 → SQL WHERE 절 컬럼 매핑 (Phase 18)
 ENTITY_ID_COLUMNS = {
     "patent": "documentid",
@@ -293,27 +316,22 @@ def _enhance_multi_entity(
     }
 
 
-def _get_collections_for_entities(entity_types: List[str]) -> List[str]:
+def _get_collections_for_entities(entity_types: List[str]) -> Tuple[str, ...]:
     """엔티티 타입에 따른 컬렉션 목록 반환
 
+    엔티티 타입을 비트마스크로 OR한 뒤 사전 계산 테이블을 1회 조회합니다.
+    반환 튜플은 공유 객체이므로 수정하지 않습니다.
+
     Args:
         entity_types: 엔티티 타입 목록 (예: ["patent", "project"])
 
     Returns:
-        Qdrant 컬렉션 목록
+        Qdrant 컬렉션 튜플 (매핑되는 엔티티가 없으면 특허+과제 기본값)
     """
-    if not entity_types:
-        # 기본값: 특허와 과제 둘 다
-        return ["patents_v3_collection", "projects_v3_collection"]
-
-    collections = set()
-    for et in entity_types:
-        if et in ENTITY_TO_COLLECTION:
-            # 리스트로 변경되었으므로 update 사용
-            collections.update(ENTITY_TO_COLLECTION[et])
-
-    # 폴백도 특허+과제 둘 다
-    return list(collections) if collections else ["patents_v3_collection", "projects_v3_collection"]
+    mask = 0
+    for et in entity_types or ():
+        mask |= _ENTITY_BIT.get(et, 0)
+    return _MASK_TO_COLLECTIONS[mask]
 
 
 def build_sql_hints(
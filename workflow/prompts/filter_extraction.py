@@ -4,11 +4,16 @@
 - 국가 코드, 연도, 금액, TOP N 등 인식
 """
 
+import os
 import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+# 질문 문자열 기준 추출 결과 캐시 크기 (0이면 캐시 비활성화)
+FILTER_CACHE_SIZE = int(os.getenv("FILTER_CACHE_SIZE", "4096"))
+
 
 @dataclass
 class FilterConditions:
@@ -44,6 +49,28 @@ PREFERENCE_KEYWORDS = [
     "소기업", "소상공인", "혁신기업"
 ]
 
+
+def _compile_keyword_scanner(keywords) -> "re.Pattern":
+    """키워드 목록을 단일 정규식으로 컴파일 (질문 1회 스캔으로 전체 매칭)
+
+    lookahead로 겹치는 위치의 키워드도 모두 탐지하며, 같은 위치에서는 긴 키워드 우선
+    """
+    alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))")
+
+
+_COUNTRY_BY_KEYWORD = {
+    kw.upper(): code for code, keywords in COUNTRY_CODES.items() for kw in keywords
+}
+_COUNTRY_SCANNER = _compile_keyword_scanner(_COUNTRY_BY_KEYWORD)
+
+# 같은 위치에서 긴 키워드가 매칭되면 그 접두 키워드도 매칭된 것으로 간주 (여성기업 → 여성)
+_PREFERENCE_IMPLIED = {
+    kw: {other for other in PREFERENCE_KEYWORDS if kw.startswith(other)}
+    for kw in PREFERENCE_KEYWORDS
+}
+_PREFERENCE_SCANNER = _compile_keyword_scanner(PREFERENCE_KEYWORDS)
+
 # 연도 패턴
 YEAR_PATTERNS = [
     (r"(\d{4})년(?:부터|이후|~)", "start"),  # 2020년부터
@@ -69,6 +96,15 @@ LIMIT_PATTERNS = [
     r"(\d+)\s*건",
 ]
 
+# 패턴은 import 시 1회 컴파일 (패턴 순서 = 우선순위 유지)
+_YEAR_REGEXES = [(re.compile(pattern), ptype) for pattern, ptype in YEAR_PATTERNS]
+_AMOUNT_REGEXES = [(re.compile(pattern), multiplier) for pattern, multiplier in AMOUNT_PATTERNS]
+_LIMIT_REGEXES = [re.compile(pattern) for pattern in LIMIT_PATTERNS]
+_AMOUNT_MIN_SUFFIX = re.compile(r".*(?:이상|초과|넘는)")
+_AMOUNT_MAX_SUFFIX = re.compile(r".*(?:이하|미만|아래)")
+_ORDER_ASC_PATTERN = re.compile(r"가장\s*(작|적|낮)")
+_ENTITY_NAME_PATTERN = re.compile(r"\{([^}]+)\}")
+
 # 정렬 키워드
 ORDER_KEYWORDS = {
     "예산": ("tot_rsrh_blgn_amt", "DESC"),
@@ -85,25 +121,27 @@ ORDER_KEYWORDS = {
 
 def extract_country_codes(query: str) -> List[str]:
     """국가 코드 추출"""
-    found_codes = []
-    query_upper = query.upper()
+    return list(_extract_country_codes(query))
 
-    for code, keywords in COUNTRY_CODES.items():
-        for kw in keywords:
-            if kw.upper() in query_upper or kw in query:
-                if code not in found_codes:
-                    found_codes.append(code)
-                break
 
-    return found_codes
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _extract_country_codes(query: str) -> Tuple[str, ...]:
+    hits = {
+        _COUNTRY_BY_KEYWORD[m.group(1)]
+        for m in _COUNTRY_SCANNER.finditer(query.upper())
+    }
+    return tuple(code for code in COUNTRY_CODES if code in hits)
 
 
 def extract_year_range(query: str) -> Optional[Tuple[int, int]]:
     """연도 범위 추출"""
-    current_year = datetime.now().year
+    return _extract_year_range(query, datetime.now().year)
+
 
-    for pattern, ptype in YEAR_PATTERNS:
-        match = re.search(pattern, query)
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _extract_year_range(query: str, current_year: int) -> Optional[Tuple[int, int]]:
+    for regex, ptype in _YEAR_REGEXES:
+        match = regex.search(query)
         if match:
             if ptype == "range":
                 start_year = int(match.group(1))
@@ -125,22 +163,22 @@ def extract_year_range(query: str) -> Optional[Tuple[int, int]]:
     return None
 
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
 def extract_amount_condition(query: str) -> Tuple[Optional[int], Optional[int]]:
     """금액 조건 추출"""
     amount_min = None
     amount_max = None
 
-    for pattern, multiplier in AMOUNT_PATTERNS:
-        matches = re.findall(pattern, query)
-        for match in matches:
-            amount_str = match.replace(",", "")
+    for regex, multiplier in _AMOUNT_REGEXES:
+        for match in regex.finditer(query):
+            amount_str = match.group(1).replace(",", "")
             amount = int(float(amount_str) * multiplier)
 
-            # "이상", "초과" → min
-            if re.search(rf"{match}.*(?:이상|초과|넘는)", query):
+            # "이상", "초과" → min (금액 뒤쪽에서 탐색)
+            if _AMOUNT_MIN_SUFFIX.match(query, match.end(1)):
                 amount_min = amount
             # "이하", "미만" → max
-            elif re.search(rf"{match}.*(?:이하|미만|아래)", query):
+            elif _AMOUNT_MAX_SUFFIX.match(query, match.end(1)):
                 amount_max = amount
             else:
                 # 기본: min으로 해석
@@ -149,15 +187,17 @@ def extract_amount_condition(query: str) -> Tuple[Optional[int], Optional[int]]:
     return (amount_min, amount_max)
 
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
 def extract_limit(query: str) -> Optional[int]:
     """LIMIT 추출"""
-    for pattern in LIMIT_PATTERNS:
-        match = re.search(pattern, query)
+    for regex in _LIMIT_REGEXES:
+        match = regex.search(query)
         if match:
             return int(match.group(1))
     return None
 
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
 def extract_order_by(query: str) -> Tuple[Optional[str], str]:
     """정렬 조건 추출"""
     for keyword, (column, direction) in ORDER_KEYWORDS.items():
@@ -166,7 +206,7 @@ def extract_order_by(query: str) -> Tuple[Optional[str], str]:
             if "가장" in query:
                 return (column, "DESC")
             # "가장 작은", "가장 적은" → ASC
-            if re.search(r"가장\s*(작|적|낮)", query):
+            if _ORDER_ASC_PATTERN.search(query):
                 return (column, "ASC")
             return (column, direction)
     return (None, "DESC")
@@ -174,16 +214,21 @@ def extract_order_by(query: str) -> Tuple[Optional[str], str]:
 
 def extract_preference_keywords(query: str) -> List[str]:
     """우대/가점 키워드 추출"""
-    found = []
-    for kw in PREFERENCE_KEYWORDS:
-        if kw in query:
-            found.append(kw)
-    return found
+    return list(_extract_preference_keywords(query))
 
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _extract_preference_keywords(query: str) -> Tuple[str, ...]:
+    hits = set()
+    for m in _PREFERENCE_SCANNER.finditer(query):
+        hits |= _PREFERENCE_IMPLIED[m.group(1)]
+    return tuple(kw for kw in PREFERENCE_KEYWORDS if kw in hits)
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
 def extract_entity_name(query: str) -> Optional[str]:
     """중괄호 내 엔티티명 추출"""
-    match = re.search(r"\{([^}]+)\}", query)
+    match = _ENTITY_NAME_PATTERN.search(query)
     if match:
         return match.group(1)
     return None
@@ -196,7 +241,8 @@ def extract_filter_conditions(query: str) -> FilterConditions:
         query: 사용자 질문
 
     Returns:
-        FilterConditions 객체
+        FilterConditions 객체 (개별 추출 결과는 질문 문자열 기준으로 캐시되며,
+        리스트 필드는 호출마다 새로 생성)
     """
     # 국가 코드
     country_codes = extract_country_codes(query)
@@ -232,6 +278,20 @@ def extract_filter_conditions(query: str) -> FilterConditions:
     )
 
 
+def clear_caches() -> None:
+    """추출 결과 캐시 초기화 (테스트/설정 변경 시)"""
+    for func in (
+        _extract_country_codes,
+        _extract_year_range,
+        extract_amount_condition,
+        extract_limit,
+        extract_order_by,
+        _extract_preference_keywords,
+        extract_entity_name,
+    ):
+        func.cache_clear()
+
+
 def format_filters_for_prompt(conditions: FilterConditions) -> str:
     """필터 조건을 프롬프트용 텍스트로 포맷"""
     lines = []
@@ -9,6 +9,7 @@ import psycopg2
 import psycopg2.extras
 import os
 import json
+from types import MappingProxyType
 from typing import Dict, Optional, List
 from datetime import datetime
 from dotenv import load_dotenv
@@ -19,8 +20,8 @@ load_dotenv()
 class UserLevelMapper:
     """사용자 리터러시 레벨 매핑 및 관리"""
 
-    # 학력/직업 → 리터러시 레벨 매핑 테이블
-    LEVEL_MAPPING = {
+    # 학력/직업 → 리터러시 레벨 매핑 테이블 (읽기 전용 - 모든 인스턴스가 공유)
+    LEVEL_MAPPING = MappingProxyType({
         # ========================================
         # 학력 기반 매핑
         # ========================================
@@ -64,17 +65,20 @@ class UserLevelMapper:
         "연구기획_평가자": "L6",
         "기술정책_연구자": "L6",
         "산업분석가": "L6",
-    }
+    })
 
     # 레벨별 설명 (UI에 표시)
-    LEVEL_DESCRIPTIONS = {
+    LEVEL_DESCRIPTIONS = MappingProxyType({
         "L1": "쉬운 설명 (학생)",
         "L2": "기본 설명 (대학생/일반인)",
         "L3": "실무 중심 (중소기업)",
         "L4": "기술 상세 (연구자)",
         "L5": "전문가 (변리사/심사관)",
         "L6": "정책 동향 (담당자)",
-    }
+    })
+
+    # 유효한 리터러시 레벨
+    VALID_LEVELS = ("L1", "L2", "L3", "L4", "L5", "L6")
 
     def __init__(self):
         """데이터베이스 연결 초기화"""
@@ -106,16 +110,12 @@ class UserLevelMapper:
             2. 직업 없으면 학력 기반으로 결정
             3. 둘 다 없거나 매핑 안 되면 L2 (기본)
         """
-        # 1. 직업 우선 (더 구체적)
-        if occupation and occupation in self.LEVEL_MAPPING:
-            return self.LEVEL_MAPPING[occupation]
-
-        # 2. 학력 기반
-        if education_level and education_level in self.LEVEL_MAPPING:
-            return self.LEVEL_MAPPING[education_level]
-
-        # 3. 기본값: L2 (일반인)
-        return "L2"
+        # 1. 직업 우선 (더 구체적) → 2. 학력 기반 → 3. 기본값: L2 (일반인)
+        return (
+            self.LEVEL_MAPPING.get(occupation)
+            or self.LEVEL_MAPPING.get(education_level)
+            or "L2"
+        )
 
     def create_user_profile(
         self,
@@ -243,9 +243,8 @@ class UserLevelMapper:
             ValueError: 잘못된 레벨 값
         """
         # 레벨 유효성 검증
-        valid_levels = ["L1", "L2", "L3", "L4", "L5", "L6"]
-        if new_level not in valid_levels:
-            raise ValueError(f"Invalid level: {new_level}. Must be one of {valid_levels}")
+        if new_level not in self.VALID_LEVELS:
+            raise ValueError(f"Invalid level: {new_level}. Must be one of {list(self.VALID_LEVELS)}")
 
         conn = psycopg2.connect(**self.db_config)
         cursor = conn.cursor()
@@ -323,7 +322,7 @@ class UserLevelMapper:
 
             rows = cursor.fetchall()
 
-            stats = {level: 0 for level in ["L1", "L2", "L3", "L4", "L5", "L6"]}
+            stats = dict.fromkeys(self.VALID_LEVELS, 0)
             for row in rows:
                 stats[row[0]] = row[1]
 
@@ -341,7 +340,7 @@ class UserLevelMapper:
         Returns:
             Dict: 학력/직업 → 레벨 매핑
         """
-        return cls.LEVEL_MAPPING.copy()
+        return dict(cls.LEVEL_MAPPING)
 
     @classmethod
     def get_level_description(cls, level: str) -> str: